@@ -1,6 +1,6 @@
 from tkinter import filedialog, messagebox
 from utils.logger import get_logger
-from PIL import Image, ImageTk
+from PIL import Image
 import cv2
 import numpy as np
 import os
@@ -13,17 +13,26 @@ class FaceMatcherController:
     Handles user input and updates the model and view accordingly.
     """
     
-    def __init__(self, model, view):
+    # Size of the view's image canvases
+    DISPLAY_SIZE = (400, 400)
+    
+    def __init__(self, model, view, executor=None):
         """
         Initialize the controller with the model and view.
         
         Args:
             model: The FaceMatcherModel instance.
             view: The FaceMatcherView instance.
+            executor (concurrent.futures.Executor, optional): Runs face detection
+                off the Tk thread. Detection runs inline if omitted.
         """
         self.logger = get_logger(__name__)
         self.model = model
         self.view = view
+        self.executor = executor
+        
+        # Set while uploaded images are being processed
+        self._processing = False
         
         # Register callbacks for view events
         self._register_callbacks()
@@ -54,24 +63,77 @@ class FaceMatcherController:
         Handle uploading and processing images.
         Open a file dialog for the user to select images, then process them.
         """
+        if self._processing:
+            return  # Still processing the previous upload
+        
         # Open a file dialog for the user to select images
         file_paths = filedialog.askopenfilenames()
         
         if not file_paths:
             return  # User cancelled
-            
-        for file_path in file_paths:
-            # Process the image
-            success = self.model.process_image(file_path)
-            
+        
+        self._processing = True
+        self._process_next_upload(list(file_paths))
+    
+    def _process_next_upload(self, file_paths):
+        """
+        Process uploaded images in order until one has a usable face.
+        
+        Detection runs on the executor, and the result is handled back on the Tk thread.
+        
+        Args:
+            file_paths (list): Remaining image paths to try.
+        """
+        if not file_paths:
+            self._processing = False
+            return
+        
+        file_path = file_paths.pop(0)
+        
+        def on_processed(success):
             if success:
+                self._processing = False
                 # Display the processed image
                 self.display_uploaded_image(file_path)
                 # Match the face
                 self.match_face()
-                break  # Process only the first successful image for now
+                # Process only the first successful image for now
             else:
                 messagebox.showwarning("Warning", f"No faces detected in {os.path.basename(file_path)}")
+                self._process_next_upload(file_paths)
+        
+        # Process the image
+        self._run_in_background(self.model.process_image, on_processed, file_path)
+    
+    def _run_in_background(self, func, callback, *args):
+        """
+        Run func(*args) on the executor and pass its result to callback on the Tk thread.
+        
+        Runs func inline if the controller has no executor.
+        
+        Args:
+            func: Blocking callable to run.
+            callback: Called with the result on the Tk thread.
+            *args: Arguments for func.
+        """
+        if self.executor is None:
+            callback(func(*args))
+            return
+        
+        future = self.executor.submit(func, *args)
+        
+        def poll():
+            if not future.done():
+                self.view.root.after(50, poll)
+                return
+            try:
+                result = future.result()
+            except Exception as e:
+                self.logger.error(f"Background task failed: {e}")
+                result = False
+            callback(result)
+        
+        self.view.root.after(50, poll)
     
     def display_uploaded_image(self, image_path):
         """
@@ -81,26 +143,37 @@ class FaceMatcherController:
             image_path (str): Path to the image file.
         """
         try:
-            # Open the original image and convert to RGB
-            original_image = Image.open(image_path).convert('RGB')
+            landmarks = bool(self.model.landmarks_overlay_enabled and self.model.landmarks_2d)
+            age_gender = bool(self.model.age_gender_overlay_enabled)
+            loaded = []
             
-            # Make a copy for face processing
-            image = original_image.copy()
+            def load_original():
+                # Open the original image and convert to RGB (once, even if both canvases miss).
+                # Landmarks are in full-resolution coordinates, so only decode at reduced
+                # scale when they aren't drawn.
+                if not loaded:
+                    loaded.append(self._load_display_image(image_path, draft=not landmarks))
+                return loaded[0]
             
-            # Apply overlays if enabled
-            if self.model.landmarks_overlay_enabled and self.model.landmarks_2d:
-                image = self.overlay_landmarks(image, self.model.landmarks_2d)
+            def load_face():
+                # Make a copy for face processing
+                image = load_original().copy()
                 
-            if self.model.age_gender_overlay_enabled:
-                image = self.overlay_age_gender(
-                    image, 
-                    self.model.current_face_age,
-                    self.model.current_face_gender
-                )
+                # Apply overlays if enabled
+                if landmarks:
+                    image = self.overlay_landmarks(image, self.model.landmarks_2d)
+                    
+                if age_gender:
+                    image = self.overlay_age_gender(
+                        image, 
+                        self.model.current_face_age,
+                        self.model.current_face_gender
+                    )
+                return image
             
-            # Display images in the view
-            self.view.display_uploaded_image(image)
-            self.view.display_full_uploaded_image(original_image)
+            # Display images in the view; they are only loaded if the view hasn't cached them
+            self.view.display_uploaded_image(load_face, cache_key=(image_path, landmarks, age_gender))
+            self.view.display_full_uploaded_image(load_original, cache_key=(image_path,))
             
         except Exception as e:
             self.logger.error(f"Error displaying uploaded image {image_path}: {e}")
@@ -138,36 +211,50 @@ class FaceMatcherController:
             return
             
         try:
-            # Load the matched face image and convert to RGB
-            matched_face = Image.open(matched_face_path).convert('RGB')
+            landmarks = bool(self.model.landmarks_overlay_enabled and 'landmark_2d_106' in face_data)
+            age_gender = bool(self.model.age_gender_overlay_enabled)
             
-            # Apply overlays if enabled
-            if self.model.landmarks_overlay_enabled and 'landmark_2d_106' in face_data:
-                matched_face = self.overlay_landmarks(matched_face, face_data['landmark_2d_106'])
+            def load_matched_face():
+                # Load the matched face image and convert to RGB
+                with Image.open(matched_face_path) as image:
+                    matched_face = image.convert('RGB')
                 
-            if self.model.age_gender_overlay_enabled:
-                matched_face = self.overlay_age_gender(
-                    matched_face, 
-                    face_data.get('age'),
-                    face_data.get('gender')
-                )
-            
-            # Display the matched face
-            self.view.display_matched_image(matched_face)
+                # Apply overlays if enabled
+                if landmarks:
+                    matched_face = self.overlay_landmarks(matched_face, face_data['landmark_2d_106'])
+                    
+                if age_gender:
+                    matched_face = self.overlay_age_gender(
+                        matched_face, 
+                        face_data.get('age'),
+                        face_data.get('gender')
+                    )
+                return matched_face
             
-            # Try to display the source image if it exists
-            if source_image_path and os.path.exists(source_image_path):
-                source_image = Image.open(source_image_path).convert('RGB')
+            def load_source_image():
+                source_image = self._open_display_image(source_image_path)
                 
                 # Apply overlays to source image if needed
-                if self.model.age_gender_overlay_enabled:
+                if age_gender:
                     source_image = self.overlay_age_gender(
                         source_image,
                         face_data.get('age'),
                         face_data.get('gender')
                     )
-                    
-                self.view.display_full_matched_image(source_image)
+                return source_image
+            
+            # Display the matched face; it is only loaded if the view hasn't cached it
+            self.view.display_matched_image(
+                load_matched_face,
+                cache_key=(matched_face_path, landmarks, age_gender)
+            )
+            
+            # Try to display the source image if it exists
+            if source_image_path and os.path.exists(source_image_path):
+                self.view.display_full_matched_image(
+                    load_source_image,
+                    cache_key=(source_image_path, face_data.get('age'), face_data.get('gender'), age_gender)
+                )
             
             # Update the match info text with all available information
             match_info = {
@@ -274,6 +361,47 @@ class FaceMatcherController:
             # Open the dialog
             ScraperDialog(self.view.root, scrape_and_download, process_images)
     
+    def _load_display_image(self, image_path, draft=True):
+        """
+        Get an uploaded image for display as RGB, reusing the model's decoded copy.
+        
+        The model keeps the image the detector decoded, which is also the one
+        the landmarks were found in; other images are read from disk.
+        
+        Args:
+            image_path (str): Path to the image file.
+            draft (bool): Whether to decode at reduced scale when reading from disk.
+            
+        Returns:
+            PIL.Image: The image in RGB mode.
+        """
+        image = self.model.current_image
+        if image is not None and self.model.current_image_path == image_path:
+            return Image.fromarray(cv2.cvtColor(image, cv2.COLOR_BGR2RGB))
+        return self._open_display_image(image_path, draft)
+    
+    @classmethod
+    def _open_display_image(cls, image_path, draft=True):
+        """
+        Open an image for display and convert it to RGB.
+        
+        For JPEGs, draft mode lets the decoder scale down by 1/2, 1/4 or 1/8
+        while decoding, as long as the result still covers the display size.
+        
+        Args:
+            image_path (str): Path to the image file.
+            draft (bool): Whether to decode at reduced scale where possible.
+            
+        Returns:
+            PIL.Image: The image in RGB mode.
+        """
+        # Close the file-backed image as soon as the RGB copy is decoded
+        with Image.open(image_path) as image:
+            if draft:
+                # No-op for formats without draft support
+                image.draft('RGB', cls.DISPLAY_SIZE)
+            return image.convert('RGB')
+    
     @staticmethod
     def overlay_landmarks(image, landmarks):
         """
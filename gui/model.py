@@ -28,6 +28,7 @@ class FaceMatcherModel:
         
         # Initialize state variables
         self.current_image_path = None
+        self.current_image = None
         self.current_face_encoding = None
         self.current_face_age = None
         self.current_face_gender = None
@@ -67,6 +68,7 @@ class FaceMatcherModel:
         
         # Reset current state
         self.current_image_path = image_path
+        self.current_image = None
         self.current_face_encoding = None
         self.current_face_age = None
         self.current_face_gender = None
@@ -77,6 +79,9 @@ class FaceMatcherModel:
             # Load and process the image
             image, faces = self.face_detector.process_image(image_path)
             
+            # Keep the decoded BGR image so displaying it doesn't decode the file again
+            self.current_image = image
+            
             if not faces:
                 self.logger.warning(f"No faces detected in {image_path}")
                 return False
@@ -92,17 +97,17 @@ class FaceMatcherModel:
             face_info = self.face_detector.extract_face_info(face)
             
             # Store face data
-            self.current_face_encoding = face_info['face_embedding']
-            self.current_face_age = face_info['age']
-            self.current_face_gender = face_info['gender']
-            self.current_face_pose = face_info['pose']
+            self.current_face_encoding = face_info.face_embedding
+            self.current_face_age = face_info.age
+            self.current_face_gender = face_info.gender
+            self.current_face_pose = face_info.pose
             
             # Store landmarks if available
-            if 'landmark_2d_106' in face_info:
-                self.landmarks_2d = face_info['landmark_2d_106']
-            elif 'landmark_3d_68' in face_info:
+            if face_info.landmark_2d_106 is not None:
+                self.landmarks_2d = face_info.landmark_2d_106
+            elif face_info.landmark_3d_68 is not None:
                 # Convert 3D landmarks to 2D by ignoring Z coordinate
-                self.landmarks_2d = [(x, y) for x, y, _ in face_info['landmark_3d_68']]
+                self.landmarks_2d = [(x, y) for x, y, _ in face_info.landmark_3d_68]
             
             return True
             
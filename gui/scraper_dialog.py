@@ -1,21 +1,85 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import threading
+import queue
 import asyncio
 import sys
 import os
+import subprocess
 import time
 import json
+import logging
 import tempfile
+import collections
+import functools
+import importlib
+import mmap
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from utils.logger import get_logger
 from processing.face_encoder import FaceEncoder
+from processing.face_db import dumps, sync_file, connect_sqlite, insert_records, SQLITE_FILE
+from processing.postproc import filter_faces_by_size
+from processing.quantization import compact_embedding
 from utils.config import Config
 
+try:
+    import orjson
+except ImportError:
+    # orjson is optional; fall back to the standard library parser
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:
+    # uvloop is optional (and unavailable on Windows); use the standard event loop
+    uvloop = None
+
+@dataclass
+class ScraperParams:
+    """Validated settings for a profile scraper run."""
+    
+    __slots__ = ('profile_count', 'scrape_count', 'images_per_profile', 'target_count')
+    
+    profile_count: int
+    scrape_count: int
+    images_per_profile: int
+    target_count: int
+
+class CoalescingIntVar(tk.IntVar):
+    """
+    IntVar that skips the Tcl write when the value hasn't changed.
+    
+    Writes made from the Tcl side (e.g. an indeterminate progress bar animating
+    its linked variable) bypass the cache; call reset_cache() after those.
+    """
+    
+    def __init__(self, master=None, value=None, name=None):
+        super().__init__(master, value, name)
+        self._last = value
+    
+    def set(self, value):
+        """Set the variable to value unless it already holds it."""
+        if value != self._last:
+            self._last = value
+            super().set(value)
+    
+    def reset_cache(self):
+        """Forget the last written value so the next set() always writes."""
+        self._last = None
+
 class ScraperDialog:
     """
     Dialog for controlling the web scraper functionality with improved integration.
     """
     
+    # Profile scrapers by key: (controller module, pipeline function, display name,
+    # whether the pipeline makes HTTP requests gated by the run's request limit)
+    SCRAPER_CONFIGS = {
+        'instagram': ('scraper.instagram_controller', 'scrape_instagram_profiles', 'Instagram', True),
+        'twitter': ('scraper.twitter_controller', 'scrape_twitter_profiles', 'Twitter', False),
+    }
+    
     def __init__(self, parent, scraper_callback, processor_callback=None):
         """
         Initialize the scraper dialog.
@@ -34,8 +98,47 @@ class ScraperDialog:
         self.target_selector = None
         self.person_scraper = None
         
+        # Face detector shared by every processing run (created on first use)
+        self.face_detector = None
+        self._face_detector_lock = threading.Lock()
+        
+        # Ready-to-use face encoders keyed by (db_folder, cropped_face_folder), closed with the dialog
+        self._encoder_cache = {}
+        
+        # Directories already created while moving processed images
+        self._mkdir_cache = set()
+        self._subdir_cache = {}
+        
+        # Background writer for database batches and history records
+        self._save_lock = threading.Lock()
+        self._save_queue = None
+        self._save_thread = None
+        self._save_users = 0
+        self._failed_save_faces = 0
+        
+        # Set once the dialog is closed so worker threads stop touching Tk
+        self._shutdown = threading.Event()
+        
+        # Log messages from worker threads waiting to be flushed to the log widget
+        self._log_buf = collections.deque()
+        self._log_lock = threading.Lock()
+        self._log_flush_pending = False
+        
+        # Single event loop shared by all scraper runs, driven by a background thread
+        self._loop = self._new_event_loop()
+        self._http_session = None
+        
+        # Single writer for discovered-profile files, running on the shared loop.
+        # Imported here since the scraper package pulls in Selenium.
+        from scraper.profile_writer import ProfileWriter
+        self._profile_writer = ProfileWriter()
+        self._loop.call_soon_threadsafe(self._loop.create_task, self._profile_writer.run())
+        self._loop_thread = threading.Thread(target=self._run_event_loop, daemon=True)
+        self._loop_thread.start()
+        
         # Create a new top-level window
         self.dialog = tk.Toplevel(parent)
+        self.dialog.bind("<Destroy>", self._on_destroy)
         self.dialog.title("Web Scraper")
         self.dialog.geometry("700x600")
         self.dialog.resizable(True, True)
@@ -50,11 +153,18 @@ class ScraperDialog:
         # Initialize state
         self.scraper_running = False
         self.processor_running = False
-        self.scraper_thread = None
+        self.scraper_future = None
         
         # Path to last downloaded images (used for processing)
         self.last_download_path = None
         self.download_stats = None
+        
+        # Settings of the current profile scraper run
+        self._active_params = None
+        
+        # Latest scraper statistics, applied to the UI by a periodic pump
+        self._pending_stats = None
+        self._stats_pump_id = self.dialog.after(100, self._pump_stats)
     
     def _create_ui(self):
         """Create the UI elements for the dialog."""
@@ -480,11 +590,22 @@ class ScraperDialog:
             self.folder_var.set(folder)
     
     def _load_history(self):
-        """Load batch history from records."""
-        # Clear existing items
-        for item in self.history_tree.get_children():
-            self.history_tree.delete(item)
+        """Load batch history from records off the Tk thread, then refresh the list."""
+        future = asyncio.run_coroutine_threadsafe(self._read_history(), self._loop)
+        future.add_done_callback(self._history_read_done)
+    
+    async def _read_history(self):
+        """Read the batch history records in the default executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._load_history_sync)
+    
+    def _load_history_sync(self):
+        """
+        Read batch history records from disk.
         
+        Returns:
+            list: (date, batch_name, images, faces, status, file_path) tuples, newest first.
+        """
         # Get history directory
         history_dir = os.path.join(
             self.config.get('Paths', 'DatabaseFolder', fallback="data/database"),
@@ -495,12 +616,11 @@ class ScraperDialog:
         os.makedirs(history_dir, exist_ok=True)
         
         # Check for history files
+        history_items = []
         try:
-            import json
             import glob
             
             history_files = glob.glob(os.path.join(history_dir, "*.json"))
-            history_items = []
             
             for file_path in history_files:
                 try:
@@ -520,13 +640,38 @@ class ScraperDialog:
             
             # Sort by date (newest first)
             history_items.sort(reverse=True)
-            
-            # Add to treeview
-            for date, batch_name, images, faces, status, file_path in history_items:
-                self.history_tree.insert("", "end", values=(date, batch_name, images, faces, status), tags=(file_path,))
                 
         except Exception as e:
             self.logger.error(f"Error loading history: {e}")
+        
+        return history_items
+    
+    def _history_read_done(self, future):
+        """Hand the loaded history back to the Tk thread unless the dialog has closed."""
+        if future.cancelled() or self._shutdown.is_set():
+            return
+        
+        try:
+            rows = future.result()
+        except Exception as e:
+            self.logger.error(f"Error loading history: {e}")
+            return
+        
+        self.dialog.after(0, self._apply_history, rows)
+    
+    def _apply_history(self, rows):
+        """
+        Replace the history list contents.
+        
+        Args:
+            rows (list): Rows returned by _load_history_sync.
+        """
+        # Clear existing items
+        self.history_tree.delete(*self.history_tree.get_children())
+        
+        # Add to treeview
+        for date, batch_name, images, faces, status, file_path in rows:
+            self.history_tree.insert("", "end", values=(date, batch_name, images, faces, status), tags=(file_path,))
     
     def _on_history_double_click(self, event):
         """Handle double-click on history item."""
@@ -650,21 +795,17 @@ class ScraperDialog:
         self.status_label.config(text="Scraping in progress...")
         self.log("Starting scraper...")
         
-        # Create and start the scraper thread
-        self.scraper_thread = threading.Thread(
-            target=self._run_scraper,
-            args=(
-                url,
-                max_pages,
-                max_images,
-                batch_size,
-                batch_name,
-                self.skip_crawl_var.get(),
-                self.skip_download_var.get()
-            )
+        # Run the scraper on a worker thread
+        self.scraper_future = self._submit_worker(
+            self._run_scraper,
+            url,
+            max_pages,
+            max_images,
+            batch_size,
+            batch_name,
+            self.skip_crawl_var.get(),
+            self.skip_download_var.get()
         )
-        self.scraper_thread.daemon = True
-        self.scraper_thread.start()
     
     def start_processor(self):
         """Start processing images in a separate thread."""
@@ -710,19 +851,15 @@ class ScraperDialog:
         self.skipped_images_label.config(text="0")
         self.error_images_label.config(text="0")
         
-        # Create and start the processor thread
-        processor_thread = threading.Thread(
-            target=self._run_processor,
-            args=(
-                source_folder,
-                min_face_size,
-                batch_size,
-                self.skip_existing_var.get(),
-                self.move_processed_var.get()
-            )
+        # Run the processor on a worker thread
+        self._submit_worker(
+            self._run_processor,
+            source_folder,
+            min_face_size,
+            batch_size,
+            self.skip_existing_var.get(),
+            self.move_processed_var.get()
         )
-        processor_thread.daemon = True
-        processor_thread.start()
     
     def _run_scraper(self, url, max_pages, max_images, batch_size, batch_name, skip_crawl, skip_download):
         """
@@ -738,10 +875,6 @@ class ScraperDialog:
             skip_download (bool): Whether to skip downloading.
         """
         try:
-            # Create a new event loop for this thread
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
             # Prepare custom download directory if batch name provided
             download_dir = self.config.get('Paths', 'DownloadFolder', fallback="data/downloaded_images")
             if batch_name:
@@ -749,8 +882,8 @@ class ScraperDialog:
                 timestamp = time.strftime("%Y%m%d_%H%M%S")
                 download_dir = os.path.join(download_dir, f"{batch_name}_{timestamp}")
             
-            # Run the scraper
-            image_urls, stats = loop.run_until_complete(
+            # Run the scraper on the shared event loop
+            image_urls, stats = self._run_coroutine(
                 self.scraper_callback(
                     url,
                     max_pages,
@@ -794,8 +927,8 @@ class ScraperDialog:
             
         except Exception as e:
             # Report error
-            self._update_ui(f"Error: {str(e)}")
-            self.logger.error(f"Scraper error: {e}", exc_info=True)
+            self._update_ui(f"Error: {e}")
+            self.logger.error("Scraper error: %s", e, exc_info=self.logger.isEnabledFor(logging.DEBUG))
         finally:
             # Clean up
             self._update_ui("Scraper operation complete.")
@@ -812,6 +945,8 @@ class ScraperDialog:
             skip_existing (bool): Whether to skip existing images.
             move_processed (bool): Whether to move processed images.
         """
+        move_pool = None
+        save_queue = None
         try:
             # Set up statistics tracking
             stats = {
@@ -832,22 +967,24 @@ class ScraperDialog:
             os.makedirs(db_folder, exist_ok=True)
             os.makedirs(cropped_face_folder, exist_ok=True)
             
+            # Batches are saved by the background writer thread, held open until this run ends
+            save_queue = self._acquire_save_queue()
+            if save_queue is None:
+                return
+            self._failed_save_faces = 0
+            
+            # Processed images are moved in parallel since each move is independent
+            move_pool = ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1))
+            
             self.logger.info(f"Processing images from: {source_folder}")
             self.logger.info(f"Database folder: {db_folder}")
             self.logger.info(f"Cropped faces folder: {cropped_face_folder}")
             
-            # Initialize face encoder
-            from processing.face_encoder import FaceEncoder
-            face_encoder = FaceEncoder(
-                img_folder=source_folder,
-                db_path=db_folder,
-                cropped_face_folder=cropped_face_folder
-            )
+            # Get a pooled face encoder pointed at the source folder
+            face_encoder = self._get_encoder(source_folder, db_folder, cropped_face_folder)
             
-            # Get list of image files
-            image_files = []
-            for ext in ['.jpg', '.jpeg', '.png', '.bmp']:
-                image_files.extend(self._find_files(source_folder, ext))
+            # Get list of image files in a single walk
+            image_files = self._find_files(source_folder, FaceEncoder.IMAGE_EXTENSIONS)
             
             stats['total_images'] = len(image_files)
             self._update_stats(stats)
@@ -855,10 +992,14 @@ class ScraperDialog:
             # Display determinate progress if we know the total
             self.dialog.after(0, self._set_process_progress_mode, "determinate")
             
+            # Index the database once; the encoder may be reused from an earlier run
+            if skip_existing:
+                face_encoder._load_processed_index()
+            
             # Process images in batches
             for i in range(0, len(image_files), batch_size):
                 # Stop if dialog was closed
-                if not hasattr(self, 'dialog') or not self.dialog.winfo_exists():
+                if self._shutdown.is_set():
                     break
                     
                 # Get batch of files
@@ -866,11 +1007,13 @@ class ScraperDialog:
                 
                 # Process the batch
                 face_buffer = []
+                move_futures = {}
                 for img_path in batch_files:
+                    # Stop mid-batch if the dialog was closed; the images handled so far are still saved below
+                    if self._shutdown.is_set():
+                        break
+                    
                     try:
-                        # Normalize path for Windows
-                        img_path = os.path.normpath(os.path.abspath(img_path))
-                        
                         # Skip if already processed and skip_existing is True
                         if skip_existing and face_encoder._is_face_in_database(img_path):
                             stats['skipped_images'] += 1
@@ -883,7 +1026,7 @@ class ScraperDialog:
                         if face_data_list:
                             # Filter faces by size if needed
                             if min_face_size > 0:
-                                face_data_list = [f for f in face_data_list if self._check_face_size(f, min_face_size)]
+                                face_data_list = filter_faces_by_size(face_data_list, min_face_size)
                             
                             face_buffer.extend(face_data_list)
                             stats['faces_found'] += len(face_data_list)
@@ -891,55 +1034,34 @@ class ScraperDialog:
                             
                             # Move to faces folder if requested
                             if move_processed:
-                                try:
-                                    faces_dir = os.path.join(os.path.dirname(img_path), "faces")
-                                    os.makedirs(faces_dir, exist_ok=True)
-                                    dest_path = os.path.join(faces_dir, os.path.basename(img_path))
-                                    if os.path.exists(dest_path):
-                                        os.remove(dest_path)
-                                    os.rename(img_path, dest_path)
-                                except Exception as e:
-                                    self.logger.error(f"Error moving file to faces folder: {e}")
+                                faces_dir = self._subdir(os.path.dirname(img_path), "faces")
+                                dest_path = os.path.join(faces_dir, os.path.basename(img_path))
+                                move_futures[move_pool.submit(os.replace, img_path, dest_path)] = dest_path
                         else:
                             # No faces found
                             if move_processed:
-                                try:
-                                    no_faces_dir = os.path.join(os.path.dirname(img_path), "no_faces")
-                                    os.makedirs(no_faces_dir, exist_ok=True)
-                                    dest_path = os.path.join(no_faces_dir, os.path.basename(img_path))
-                                    if os.path.exists(dest_path):
-                                        os.remove(dest_path)
-                                    os.rename(img_path, dest_path)
-                                except Exception as e:
-                                    self.logger.error(f"Error moving file to no_faces folder: {e}")
+                                no_faces_dir = self._subdir(os.path.dirname(img_path), "no_faces")
+                                dest_path = os.path.join(no_faces_dir, os.path.basename(img_path))
+                                move_futures[move_pool.submit(os.replace, img_path, dest_path)] = dest_path
                     except Exception as e:
                         self.logger.error(f"Error processing image {img_path}: {e}")
                         stats['error_images'] += 1
                 
-                # Save the batch to database if we have faces
-                if face_buffer:
+                # Wait for this batch's file moves and report any failures
+                for future, dest_path in move_futures.items():
                     try:
-                        # Generate timestamp-based filename
-                        timestamp = int(time.time())
-                        db_filename = f"face_data_batch_{timestamp}.json"
-                        db_file_path = os.path.join(db_folder, db_filename)
-                        
-                        # Save using atomic write pattern
-                        with tempfile.NamedTemporaryFile('w', delete=False, dir=db_folder, suffix='.json') as tmp_file:
-                            json.dump(face_buffer, tmp_file, indent=2)
-                            tmp_file.flush()
-                            os.fsync(tmp_file.fileno())
-                            tmp_path = tmp_file.name
-                        
-                        # Rename temp file to final filename
-                        if os.path.exists(db_file_path):
-                            os.remove(db_file_path)
-                        os.rename(tmp_path, db_file_path)
-                        
-                        self.logger.info(f"Saved {len(face_buffer)} faces to {db_file_path}")
+                        future.result()
                     except Exception as e:
-                        self.logger.error(f"Error saving face data to database: {e}")
-                        stats['faces_added'] -= len(face_buffer)
+                        self.logger.error(f"Error moving file to {dest_path}: {e}")
+                
+                # Hand the batch to the writer thread so detection continues while it saves
+                face_encoder.flush_writes()
+                if face_buffer:
+                    # Generate timestamp-based filename
+                    timestamp = int(time.time())
+                    db_filename = f"face_data_batch_{timestamp}.json"
+                    db_file_path = os.path.join(db_folder, db_filename)
+                    save_queue.put((face_buffer, db_file_path, 'faces'))
                 
                 # Update UI
                 progress = (i + len(batch_files)) / len(image_files) * 100
@@ -947,6 +1069,11 @@ class ScraperDialog:
                 self._update_stats(stats)
                 self._update_ui(f"Processed batch {i//batch_size + 1}/{(len(image_files) + batch_size - 1)//batch_size}. Found {stats['faces_found']} faces.")
             
+            # Wait for pending saves before verifying the database
+            save_queue.join()
+            stats['faces_added'] -= self._failed_save_faces
+            self._update_stats(stats)
+            
             # Verify database after processing
             self.logger.info("Verifying database...")
             db_stats = face_encoder.verify_database()
@@ -970,26 +1097,226 @@ class ScraperDialog:
             self._update_ui(f"Processing error: {str(e)}")
             self.logger.error(f"Image processor error: {e}", exc_info=True)
         finally:
+            if move_pool is not None:
+                move_pool.shutdown(wait=True)
+            if save_queue is not None:
+                self._release_save_queue()
             self.dialog.after(0, self._processing_complete)
     
-    def _find_files(self, directory, extension):
-        """Find files with the given extension in the directory and subdirectories."""
+    def _get_encoder(self, img_folder, db_folder, cropped_face_folder):
+        """
+        Get a cached face encoder for the given output folders, creating it on first use.
+        
+        Args:
+            img_folder (str): Folder containing images for processing.
+            db_folder (str): Path to the face database.
+            cropped_face_folder (str): Folder to save cropped faces.
+            
+        Returns:
+            FaceEncoder: Encoder pointed at img_folder.
+        """
+        key = (db_folder, cropped_face_folder)
+        face_encoder = self._encoder_cache.get(key)
+        if face_encoder is None:
+            face_encoder = FaceEncoder(
+                img_folder=img_folder,
+                db_path=db_folder,
+                cropped_face_folder=cropped_face_folder,
+                face_detector=self._get_face_detector()
+            )
+            self._encoder_cache[key] = face_encoder
+        else:
+            face_encoder.set_img_folder(img_folder)
+        return face_encoder
+    
+    def _get_face_detector(self):
+        """
+        Get the face detector shared across processing runs, creating it on first use.
+        
+        Loading the detection model is expensive (and pins it on the GPU when one is
+        configured), so it is created once per dialog rather than once per run.
+        
+        Returns:
+            FaceDetector: The shared face detector.
+        """
+        with self._face_detector_lock:
+            if self.face_detector is None:
+                from processing.face_detector import FaceDetector
+                self.face_detector = FaceDetector()
+                self.logger.info(f"Created shared face detector (providers: {self.face_detector.providers})")
+            return self.face_detector
+    
+    def _acquire_save_queue(self):
+        """
+        Get the queue feeding the background writer thread, starting the thread if needed.
+        
+        The writer persists for the lifetime of the dialog and handles both face
+        batches and batch history records. Each caller keeps it running until it
+        calls _release_save_queue, so closing the dialog never stops the writer
+        under a run that still has batches to queue or wait for.
+        
+        Returns:
+            queue.Queue: Queue accepting (data, file_path, kind) items, or None
+                once the dialog is closing.
+        """
+        with self._save_lock:
+            if self._shutdown.is_set():
+                return None
+            if self._save_thread is None:
+                self._save_queue = queue.Queue(maxsize=2)
+                self._save_thread = threading.Thread(target=self._save_loop, args=(self._save_queue,), daemon=True)
+                self._save_thread.start()
+            self._save_users += 1
+            return self._save_queue
+    
+    def _release_save_queue(self):
+        """Release a queue from _acquire_save_queue, stopping the writers if the dialog has closed."""
+        with self._save_lock:
+            self._save_users -= 1
+        if self._shutdown.is_set():
+            self._stop_writers()
+    
+    def _stop_writers(self):
+        """
+        Let the writer thread finish pending writes and exit, and close the pooled
+        face encoders, once no run is using them.
+        
+        Processing runs hold the save queue for their whole duration, so no
+        encoder is in use once it has no holders left.
+        """
+        with self._save_lock:
+            if self._save_users:
+                return
+            if self._save_thread is not None:
+                self._save_queue.put(None)
+                self._save_thread = None
+            encoders, self._encoder_cache = self._encoder_cache, {}
+        
+        for face_encoder in encoders.values():
+            try:
+                face_encoder.close()
+            except Exception as e:
+                self.logger.error(f"Error closing face encoder: {e}")
+    
+    def _save_loop(self, save_queue):
+        """
+        Write queued items to disk until a None sentinel is received.
+        
+        Items are (data, file_path, kind) tuples where kind is 'faces' for a face
+        batch or 'history' for a batch history record.
+        
+        Args:
+            save_queue (queue.Queue): Queue to consume.
+        """
+        embedding_format = self.config.get('FaceMatching', 'EmbeddingFormat', fallback='int8').strip().lower()
+        db_format = self.config.get('Paths', 'DatabaseFormat', fallback='sqlite').strip().lower()
+        conn = None
+        
+        while True:
+            item = save_queue.get()
+            try:
+                if item is None:
+                    break
+                
+                data, file_path, kind = item
+                try:
+                    if kind == 'faces' and db_format == 'sqlite':
+                        # Face batches go into the folder's SQLite database in one transaction
+                        db_folder = os.path.dirname(file_path)
+                        if conn is None:
+                            conn = connect_sqlite(db_folder)
+                        insert_records(conn, data, embedding_format)
+                        file_path = os.path.join(db_folder, SQLITE_FILE)
+                    else:
+                        if kind == 'faces':
+                            # Store embeddings in the compact configured format
+                            for face_data in data:
+                                compact_embedding(face_data, embedding_format)
+                        
+                        self._atomic_write_json(data, file_path)
+                    
+                    if kind == 'faces':
+                        self.logger.info(f"Saved {len(data)} faces to {file_path}")
+                    else:
+                        # Refresh history now that the record is on disk
+                        if not self._shutdown.is_set():
+                            self.dialog.after(0, self._load_history)
+                except Exception as e:
+                    if kind == 'faces':
+                        self.logger.error(f"Error saving face data to database: {e}")
+                        self._failed_save_faces += len(data)
+                    else:
+                        self.logger.error(f"Error saving batch history: {e}")
+            finally:
+                save_queue.task_done()
+        
+        if conn is not None:
+            conn.close()
+    
+    def _atomic_write_json(self, data, file_path):
+        """
+        Write data as compact JSON using a temporary file and an atomic rename.
+        
+        Args:
+            data: JSON-serializable data.
+            file_path (str): Destination file path.
+        """
+        with tempfile.NamedTemporaryFile('wb', delete=False, dir=os.path.dirname(file_path), suffix='.json') as tmp_file:
+            tmp_file.write(dumps(data))
+            sync_file(tmp_file)
+            tmp_path = tmp_file.name
+        
+        os.replace(tmp_path, file_path)
+    
+    def _ensure_dir(self, directory):
+        """
+        Create a directory once, skipping the makedirs call for directories already seen.
+        
+        Args:
+            directory (str): Directory to create.
+        """
+        if directory not in self._mkdir_cache:
+            os.makedirs(directory, exist_ok=True)
+            self._mkdir_cache.add(directory)
+    
+    def _subdir(self, parent, name):
+        """
+        Get (and create on first use) a named subdirectory, memoized per parent directory.
+        
+        Args:
+            parent (str): Parent directory.
+            name (str): Subdirectory name, e.g. "faces" or "no_faces".
+            
+        Returns:
+            str: Path to the subdirectory.
+        """
+        key = (parent, name)
+        path = self._subdir_cache.get(key)
+        if path is None:
+            path = os.path.join(parent, name)
+            self._ensure_dir(path)
+            self._subdir_cache[key] = path
+        return path
+    
+    def _find_files(self, directory, extensions):
+        """
+        Find files with any of the given extensions in the directory and subdirectories.
+        
+        Extensions are given without the dot and matched case-insensitively; only
+        the extension is lowercased, and only when it doesn't match as-is.
+        
+        Paths are normalized here so callers don't need to normalize them per file;
+        they are absolute when the given directory is absolute.
+        """
+        extensions = frozenset(ext.lower() for ext in extensions)
         files = []
         for root, _, filenames in os.walk(directory):
             for filename in filenames:
-                if filename.lower().endswith(extension.lower()):
-                    files.append(os.path.join(root, filename))
+                _, dot, ext = filename.rpartition('.')
+                if dot and (ext in extensions or ext.lower() in extensions):
+                    files.append(os.path.normpath(os.path.join(root, filename)))
         return files
     
-    def _check_face_size(self, face_data, min_size):
-        """Check if a face meets the minimum size requirement."""
-        if 'bbox' in face_data:
-            bbox = face_data['bbox']
-            width = bbox[2] - bbox[0]
-            height = bbox[3] - bbox[1]
-            return width >= min_size and height >= min_size
-        return True  # If no bbox, assume it's valid
-    
     def _update_progress(self, value):
         """Update the progress bar."""
         self.dialog.after(0, self.process_progress_var.set, value)
@@ -1034,12 +1361,9 @@ class ScraperDialog:
                 self.config.get('Paths', 'DatabaseFolder', fallback="data/database"),
                 "history"
             )
-            os.makedirs(history_dir, exist_ok=True)
+            self._ensure_dir(history_dir)
             
             # Create batch record
-            import json
-            import time
-            
             batch_data = {
                 'batch_name': batch_name,
                 'date': time.strftime("%Y-%m-%d %H:%M:%S"),
@@ -1057,15 +1381,16 @@ class ScraperDialog:
                 'status': 'Downloaded'
             }
             
-            # Save to file
+            # Queue the record for the background writer, which refreshes history once saved
             filename = f"batch_{int(time.time())}.json"
             file_path = os.path.join(history_dir, filename)
-            
-            with open(file_path, 'w') as f:
-                json.dump(batch_data, f, indent=2)
-                
-            # Refresh history
-            self.dialog.after(0, self._load_history)
+            save_queue = self._acquire_save_queue()
+            if save_queue is None:
+                return
+            try:
+                save_queue.put((batch_data, file_path, 'history'))
+            finally:
+                self._release_save_queue()
             
         except Exception as e:
             self.logger.error(f"Error saving batch history: {e}")
@@ -1077,8 +1402,45 @@ class ScraperDialog:
         Args:
             message (str): Message to log.
         """
-        if hasattr(self, 'dialog') and self.dialog.winfo_exists():
-            self.dialog.after(0, self.log, message)
+        if self._shutdown.is_set():
+            return
+        
+        # Buffer messages and flush them together so the log widget relayouts once per tick
+        with self._log_lock:
+            self._log_buf.append(message)
+            if self._log_flush_pending:
+                return
+            self._log_flush_pending = True
+        self.dialog.after(100, self._flush_log)
+    
+    def _flush_log(self):
+        """Insert all buffered log messages into the log text area with a single insert."""
+        with self._log_lock:
+            lines = list(self._log_buf)
+            self._log_buf.clear()
+            self._log_flush_pending = False
+        
+        if lines:
+            self.log("\n".join(lines))
+    
+    def _pump_stats(self):
+        """Apply the latest pending scraper statistics and elapsed time, then reschedule the pump."""
+        if self._shutdown.is_set():
+            return
+        
+        self._apply_pending_stats()
+        self._update_elapsed_time()
+        self._stats_pump_id = self.dialog.after(100, self._pump_stats)
+    
+    def _apply_pending_stats(self):
+        """Apply the most recent statistics snapshot posted by a scraper, if any."""
+        pending = self._pending_stats
+        if pending is None:
+            return
+        
+        self._pending_stats = None
+        update_status, args = pending
+        update_status(*args)
     
     def _update_ui_state(self, running):
         """
@@ -1087,7 +1449,7 @@ class ScraperDialog:
         Args:
             running (bool): Whether the scraper is running.
         """
-        if hasattr(self, 'dialog') and self.dialog.winfo_exists():
+        if not self._shutdown.is_set():
             def update():
                 self.scraper_running = running
                 self.start_button.config(state="normal" if not running else "disabled")
@@ -1097,6 +1459,110 @@ class ScraperDialog:
             
             self.dialog.after(0, update)
     
+    @staticmethod
+    def _new_event_loop():
+        """
+        Create the event loop shared by the scrapers.
+        
+        Uses uvloop when it is installed. On Windows a selector loop is used,
+        since aiohttp shuts down more reliably on it than on the proactor loop.
+        
+        Returns:
+            asyncio.AbstractEventLoop: New event loop.
+        """
+        if uvloop is not None:
+            return uvloop.new_event_loop()
+        if sys.platform == 'win32':
+            return asyncio.SelectorEventLoop()
+        return asyncio.new_event_loop()
+    
+    def _run_event_loop(self):
+        """Run the shared event loop until it is stopped, then cancel leftover tasks and close it."""
+        asyncio.set_event_loop(self._loop)
+        try:
+            self._loop.run_forever()
+        finally:
+            # Write out profiles the scrapers submitted before stopping the writer
+            self._loop.run_until_complete(self._profile_writer.flush())
+            
+            pending = asyncio.all_tasks(self._loop)
+            for task in pending:
+                task.cancel()
+            if pending:
+                self._loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+            if self._http_session is not None and not self._http_session.closed:
+                self._loop.run_until_complete(self._http_session.close())
+            self._loop.close()
+    
+    async def _get_http_session(self):
+        """
+        Get the HTTP session shared by all scraper runs, creating it on first use.
+        
+        Must be awaited on the shared event loop, which owns the session.
+        
+        Returns:
+            aiohttp.ClientSession: Shared session with a bounded connection pool.
+        """
+        if self._http_session is None or self._http_session.closed:
+            import aiohttp
+            connector = aiohttp.TCPConnector(
+                limit=500,
+                limit_per_host=64,
+                ttl_dns_cache=300,
+                keepalive_timeout=30,
+                enable_cleanup_closed=True
+            )
+            self._http_session = aiohttp.ClientSession(connector=connector)
+        return self._http_session
+    
+    def _run_coroutine(self, coro):
+        """
+        Run a coroutine on the shared event loop and wait for its result.
+        
+        Args:
+            coro: Coroutine to run.
+            
+        Returns:
+            The coroutine's result.
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+    
+    def _submit_worker(self, fn, *args):
+        """
+        Run a blocking job on a daemon thread.
+        
+        Jobs can be left waiting on the shared event loop once the dialog stops
+        it, so they run on daemon threads, which don't hold up interpreter exit
+        the way thread pool workers do.
+        
+        Args:
+            fn: Callable to run.
+            *args: Arguments for fn.
+            
+        Returns:
+            concurrent.futures.Future: Future of the job.
+        """
+        future = Future()
+        
+        def run():
+            future.set_running_or_notify_cancel()
+            try:
+                result = fn(*args)
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+        
+        threading.Thread(target=run, name='scraper-job', daemon=True).start()
+        return future
+    
+    def _on_destroy(self, event):
+        """Flag shutdown when the dialog window is destroyed, including via the window manager."""
+        if event.widget is self.dialog:
+            self._shutdown.set()
+            self._stop_writers()
+            self._loop.call_soon_threadsafe(self._loop.stop)
+    
     def close(self):
         """Close the dialog."""
         if self.scraper_running or self.processor_running:
@@ -1104,8 +1570,12 @@ class ScraperDialog:
                 "Confirm Close",
                 "There are operations in progress. Are you sure you want to close this window?"
             ):
+                self._shutdown.set()
+                self._stop_writers()
                 self.dialog.destroy()
         else:
+            self._shutdown.set()
+            self._stop_writers()
             self.dialog.destroy()
 
     def _create_auto_tab(self):
@@ -1202,7 +1672,7 @@ class ScraperDialog:
         progress_frame = ttk.Frame(auto_frame)
         progress_frame.pack(fill=tk.X, pady=10)
         
-        self.auto_progress_var = tk.DoubleVar(value=0)
+        self.auto_progress_var = CoalescingIntVar(value=0)
         self.auto_progress_bar = ttk.Progressbar(
             progress_frame,
             variable=self.auto_progress_var,
@@ -1306,6 +1776,14 @@ class ScraperDialog:
         )
         self.twitter_button.pack(side=tk.RIGHT, padx=5)
         
+        # Run both scrapers concurrently
+        self.all_social_button = ttk.Button(
+            instagram_button_frame,
+            text="Run Both Scrapers",
+            command=self.start_all_social_scraper
+        )
+        self.all_social_button.pack(side=tk.RIGHT, padx=5)
+        
         # Show profiles button
         self.show_profiles_button = ttk.Button(
             instagram_button_frame,
@@ -1358,6 +1836,12 @@ class ScraperDialog:
             )
             return
         
+        # Target doesn't change mid-run, so parse it once for progress updates
+        self._target_count_cached = target_face_count
+        
+        # The progress bar animates its variable while indeterminate, so don't trust the cache
+        self.auto_progress_var.reset_cache()
+        
         # Get selected sources
         selected_sources = [source for source, var in self.source_vars.items() if var.get()]
         if not selected_sources:
@@ -1382,38 +1866,34 @@ class ScraperDialog:
         self.elapsed_time_label.config(text="00:00:00")
         self.current_source_label.config(text="Initializing...")
         
-        # Initialize progress updater
+        # Start timing the run; the stats pump renders the elapsed time
         self.start_time = time.time()
-        self.update_id = self.dialog.after(1000, self._update_elapsed_time)
-        
-        # Create and start the thread
-        auto_thread = threading.Thread(
-            target=self._run_social_scraper,
-            args=(
-                target_face_count,
-                max_runtime,
-                selected_sources
-            )
+        self._start_mono = time.monotonic()
+        self._last_time_str = None
+        
+        # Run the social scraper on a worker thread
+        self._submit_worker(
+            self._run_social_scraper,
+            target_face_count,
+            max_runtime,
+            selected_sources
         )
-        auto_thread.daemon = True
-        auto_thread.start()
 
     def _update_elapsed_time(self):
-        """Update the elapsed time display."""
-        if not hasattr(self, 'start_time') or not self.auto_mode_running:
+        """Update the elapsed time display; driven by the stats pump while a run is active."""
+        if not hasattr(self, '_start_mono') or not self.auto_mode_running:
             return
         
-        elapsed = time.time() - self.start_time
-        hours = int(elapsed // 3600)
-        minutes = int((elapsed % 3600) // 60)
-        seconds = int(elapsed % 60)
+        elapsed = time.monotonic() - self._start_mono
+        hours, remainder = divmod(int(elapsed), 3600)
+        minutes, seconds = divmod(remainder, 60)
         
+        # Only reconfigure the label when the displayed second changes
         time_str = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-        self.elapsed_time_label.config(text=time_str)
+        if time_str != self._last_time_str:
+            self.elapsed_time_label.config(text=time_str)
+            self._last_time_str = time_str
         
-        # Continue updating if still running
-        if self.auto_mode_running:
-            self.update_id = self.dialog.after(1000, self._update_elapsed_time)
 
     def _run_social_scraper(self, target_face_count, max_runtime, selected_sources):
         """Run the social media scraper in a separate thread."""
@@ -1438,13 +1918,10 @@ class ScraperDialog:
             self.person_scraper = AutomaticPersonScraper(
                 db_path=db_path, 
                 download_dir=social_download_dir,
-                target_selector=self.target_selector
+                target_selector=self.target_selector,
+                session=self._run_coroutine(self._get_http_session())
             )
             
-            # Set up asyncio loop for this thread
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
             # Variables for status updates
             face_count = 0
             images_processed = 0
@@ -1459,12 +1936,12 @@ class ScraperDialog:
                 sites_visited = stats.get('sites_visited', 0)
                 current_source = stats.get('current_source', current_source)
                 
-                self.dialog.after(0, self._update_social_status, 
-                                face_count, images_processed, 
-                                sites_visited, current_source)
+                self._pending_stats = (self._update_scrape_status, 
+                                      (face_count, images_processed, 
+                                       sites_visited, current_source))
             
-            # Run the scraper
-            results = loop.run_until_complete(self.person_scraper.run_automatic_mode(
+            # Run the scraper on the shared event loop
+            results = self._run_coroutine(self.person_scraper.run_automatic_mode(
                 target_face_count=target_face_count,
                 max_runtime_minutes=max_runtime
             ))
@@ -1482,67 +1959,87 @@ class ScraperDialog:
             
         except Exception as e:
             # Report error
-            self._update_ui(f"Error in social media collection: {str(e)}")
-            self.logger.error(f"Social scraper error: {e}", exc_info=True)
+            self._update_ui(f"Error in social media collection: {e}")
+            self.logger.error("Social scraper error: %s", e, exc_info=self.logger.isEnabledFor(logging.DEBUG))
         finally:
             # Clean up
-            if hasattr(self, 'update_id'):
-                self.dialog.after_cancel(self.update_id)
             self._update_ui("Social media collection complete.")
             self.dialog.after(0, self._auto_mode_complete)
 
-    def _update_social_status(self, face_count, images_processed, sites_visited, current_source):
-        """Update the social scraper status UI."""
+    def _update_scrape_status(self, face_count, images_processed, sites_visited, current_source=None):
+        """Update the automatic mode scraper status UI."""
         self.faces_collected_label.config(text=str(face_count))
         self.images_processed_label.config(text=str(images_processed))
         self.sites_visited_label.config(text=str(sites_visited))
-        self.current_source_label.config(text=current_source)
+        if current_source is not None:
+            self.current_source_label.config(text=current_source)
         
         # Update progress based on target
-        progress = min(100, (face_count / int(self.target_count_var.get())) * 100)
+        progress = min(100, (face_count * 100) // self._target_count_cached)
         self.auto_progress_bar.stop()
         self.auto_progress_bar.config(mode="determinate")
         self.auto_progress_var.set(progress)
 
     def _auto_mode_complete(self):
         """Update the UI when automatic mode is complete."""
+        # Apply final statistics before marking the progress bar complete
+        self._apply_pending_stats()
+        
         self.auto_mode_running = False
         self.auto_start_button.config(state="normal")
         self.auto_progress_bar.stop()
-        self.auto_progress_bar.config(value=100)
+        self.auto_progress_var.set(100)
         self.status_label.config(text="Automatic mode complete")
         
         # Refresh history
         self._load_history()
 
+    @staticmethod
+    def _head(items, n=2):
+        """Return the first n items as a tuple, with "..." appended if there are more."""
+        head = tuple(items[:n])
+        return head + ("...",) if len(items) > n else head
+
     def _log_configured_sources(self, target_selector):
         """Log detailed information about configured sources."""
-        # Get the first few URLs from each source to log (for debugging)
-        social_urls = target_selector.social_platforms[:2] if target_selector.social_platforms else []
-        photo_urls = target_selector.photo_sharing_sites[:2] if target_selector.photo_sharing_sites else []
-        community_urls = target_selector.community_sites[:2] if target_selector.community_sites else []
-        
-        # Add ellipsis if there are more URLs
-        if len(target_selector.social_platforms) > 2:
-            social_urls.append("...")
-        if len(target_selector.photo_sharing_sites) > 2:
-            photo_urls.append("...")
-        if len(target_selector.community_sites) > 2:
-            community_urls.append("...")
-            
-        # Log source counts and examples
-        self.logger.info(f"Configured social platforms ({len(target_selector.social_platforms)}): {social_urls}")
-        self.logger.info(f"Configured photo sites ({len(target_selector.photo_sharing_sites)}): {photo_urls}")
-        self.logger.info(f"Configured community sites ({len(target_selector.community_sites)}): {community_urls}")
+        social = target_selector.social_platforms or []
+        photo = target_selector.photo_sharing_sites or []
+        community = target_selector.community_sites or []
+        
+        # Log source counts and a few example URLs (for debugging) as a single record
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(
+                "Configured sources:\n  social(%d): %s\n  photo(%d): %s\n  community(%d): %s",
+                len(social), self._head(social),
+                len(photo), self._head(photo),
+                len(community), self._head(community)
+            )
         
         # Also update the status message in the UI
-        platforms_text = f"Social: {len(target_selector.social_platforms)}, "
-        platforms_text += f"Photo: {len(target_selector.photo_sharing_sites)}, "
-        platforms_text += f"Community: {len(target_selector.community_sites)}"
-        self._update_ui(f"Configured source counts: {platforms_text}")
+        self._update_ui(
+            f"Configured source counts: Social: {len(social)}, "
+            f"Photo: {len(photo)}, Community: {len(community)}"
+        )
 
     def start_instagram_scraper(self):
         """Start the Instagram profile discovery and scraping process."""
+        self._start_profile_scrapers(('instagram',))
+
+    def start_twitter_scraper(self):
+        """Start the Twitter profile discovery and scraping process."""
+        self._start_profile_scrapers(('twitter',))
+
+    def start_all_social_scraper(self):
+        """Start the Instagram and Twitter scrapers together on the shared event loop."""
+        self._start_profile_scrapers(('instagram', 'twitter'))
+
+    def _start_profile_scrapers(self, keys):
+        """
+        Start one or more profile scrapers on the shared event loop.
+        
+        Args:
+            keys (tuple): Keys into SCRAPER_CONFIGS of the scrapers to run together.
+        """
         if self.auto_mode_running:
             messagebox.showwarning(
                 "Process Running",
@@ -1550,113 +2047,201 @@ class ScraperDialog:
             )
             return
         
-        # Get input values
-        try:
-            profile_count = int(self.profile_count_var.get())
-            scrape_count = int(self.scrape_count_var.get())
-            images_per_profile = int(self.images_per_profile_var.get())
-            
-            if profile_count <= 0 or scrape_count <= 0 or images_per_profile <= 0:
-                raise ValueError("Values must be positive numbers")
-                
-            if scrape_count > profile_count:
-                scrape_count = profile_count
-                self.scrape_count_var.set(str(scrape_count))
-        except ValueError as e:
-            messagebox.showerror(
-                "Invalid Input",
-                f"Please enter valid settings: {str(e)}"
-            )
+        params = self._parse_params()
+        if params is None:
             return
         
+        # Target doesn't change mid-run, so parse it once for progress updates
+        self._active_params = params
+        self._target_count_cached = params.target_count
+        
+        # The progress bar animates its variable while indeterminate, so don't trust the cache
+        self.auto_progress_var.reset_cache()
+        
+        names = [self.SCRAPER_CONFIGS[key][2] for key in keys]
+        
         # Prepare UI for scraping
         self.auto_mode_running = True
-        self.instagram_button.config(state="disabled")
+        for button in self._profile_scraper_buttons():
+            button.config(state="disabled")
         self.auto_progress_bar.config(mode="indeterminate")
         self.auto_progress_bar.start(10)
-        self.status_label.config(text="Instagram scraping in progress...")
-        self.log("Starting Instagram profile discovery and scraping...")
+        self.status_label.config(text=f"{' and '.join(names)} scraping in progress...")
+        self.log(f"Starting {' and '.join(names)} profile discovery and scraping...")
         
         # Reset statistics
         self.faces_collected_label.config(text="0")
         self.images_processed_label.config(text="0")
         self.sites_visited_label.config(text="0")
-        self.current_source_label.config(text="Instagram")
+        self.current_source_label.config(text=" + ".join(names))
         
-        # Initialize progress updater
+        # Start timing the run; the stats pump renders the elapsed time
         self.start_time = time.time()
-        self.update_id = self.dialog.after(1000, self._update_elapsed_time)
-        
-        # Create and start the thread
-        instagram_thread = threading.Thread(
-            target=self._run_instagram_scraper,
-            args=(
-                profile_count,
-                scrape_count,
-                images_per_profile
-            )
-        )
-        instagram_thread.daemon = True
-        instagram_thread.start()
+        self._start_mono = time.monotonic()
+        self._last_time_str = None
+        
+        # Start the scrapers on the shared event loop
+        self._run_profile_scrapers(keys, params)
 
-    def _run_instagram_scraper(self, profile_count, scrape_count, images_per_profile):
-        """Run the Instagram scraper in a separate thread."""
+    def _parse_params(self):
+        """
+        Parse and validate the profile scraper settings.
+        
+        Shows an error dialog if the settings are invalid.
+        
+        Returns:
+            ScraperParams: Parsed settings, or None if they are invalid.
+        """
         try:
-            # Import the new Instagram controller
-            from scraper.instagram_controller import scrape_instagram_profiles
-            
-            # Run the scraper using asyncio
-            results = asyncio.run(scrape_instagram_profiles(
-                profile_count=profile_count,
-                max_profiles_to_scrape=scrape_count,
-                max_images_per_profile=images_per_profile
-            ))
+            params = ScraperParams(
+                profile_count=int(self.profile_count_var.get()),
+                scrape_count=int(self.scrape_count_var.get()),
+                images_per_profile=int(self.images_per_profile_var.get()),
+                target_count=int(self.target_count_var.get())
+            )
             
-            # Update UI with results
-            self.dialog.after(0, self._update_instagram_status, 
-                             results.get('faces_detected', 0),
-                             results.get('images_downloaded', 0),
-                             results.get('profiles_found', 0))
+            if min(params.profile_count, params.scrape_count,
+                   params.images_per_profile, params.target_count) <= 0:
+                raise ValueError("Values must be positive numbers")
+                
+            if params.scrape_count > params.profile_count:
+                params.scrape_count = params.profile_count
+                self.scrape_count_var.set(str(params.scrape_count))
+        except ValueError as e:
+            messagebox.showerror(
+                "Invalid Input",
+                f"Please enter valid settings: {str(e)}"
+            )
+            return None
+        
+        return params
+
+    def _profile_scraper_buttons(self):
+        """Return the buttons that start profile scrapers."""
+        return (self.instagram_button, self.twitter_button, self.all_social_button)
+
+    def _run_profile_scrapers(self, keys, params):
+        """Submit the profile scrapers to the shared event loop without blocking the UI."""
+        future = asyncio.run_coroutine_threadsafe(
+            self._profile_scrapers_coro(keys, params),
+            self._loop
+        )
+        future.add_done_callback(lambda done: self._profile_scrapers_done(keys, done))
+    
+    async def _profile_scrapers_coro(self, keys, params):
+        """
+        Run the selected profile scraping pipelines concurrently.
+        
+        Each platform's results are reported as soon as its pipeline finishes.
+        
+        Returns:
+            list: Statistics dict or exception for each scraper, in order.
+        """
+        # One limit on in-flight HTTP requests shared by every scraper in this run
+        semaphore = asyncio.Semaphore(min(params.images_per_profile * params.scrape_count, 128))
+        
+        tasks = []
+        for key in keys:
+            task = asyncio.ensure_future(
+                self._scraper_coro(key, params, semaphore)
+            )
+            task.add_done_callback(
+                lambda done, name=self.SCRAPER_CONFIGS[key][2]: self._report_platform_results(name, done)
+            )
+            tasks.append(task)
+        
+        return await asyncio.gather(*tasks, return_exceptions=True)
+    
+    async def _scraper_coro(self, key, params, semaphore=None):
+        """Run one platform's full scraping pipeline and return its statistics."""
+        scrape_profiles = self._get_scrape_function(key)
+        
+        # Only pipelines that make their own HTTP requests take the request limit
+        limits = {'semaphore': semaphore} if self.SCRAPER_CONFIGS[key][3] else {}
+        
+        return await scrape_profiles(
+            profile_count=params.profile_count,
+            max_profiles_to_scrape=params.scrape_count,
+            max_images_per_profile=params.images_per_profile,
+            session=await self._get_http_session(),
+            profile_writer=self._profile_writer,
+            **limits
+        )
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _get_scrape_function(key):
+        """
+        Import a platform's pipeline function once and reuse it for later runs.
+        
+        The controllers pull in Selenium, so they are imported on first use
+        rather than when the dialog module loads.
+        
+        Args:
+            key (str): Key into SCRAPER_CONFIGS.
             
-            # Report success
-            self._update_ui(
-                f"Instagram scraping completed.\n"
-                f"Found {results.get('profiles_found', 0)} profiles.\n"
-                f"Downloaded {results.get('images_downloaded', 0)} images.\n"
-                f"Detected {results.get('faces_detected', 0)} faces.\n"
-                f"Total runtime: {results.get('runtime_seconds', 0)/60:.1f} minutes"
+        Returns:
+            Coroutine function running the platform's full scraping pipeline.
+        """
+        module_name, function_name = ScraperDialog.SCRAPER_CONFIGS[key][:2]
+        return getattr(importlib.import_module(module_name), function_name)
+    
+    def _report_platform_results(self, platform, task):
+        """Log the results of one platform's scraper once it finishes."""
+        if task.cancelled():
+            self._update_ui(f"{platform} scraping was cancelled.")
+            return
+        
+        error = task.exception()
+        if error is not None:
+            self._update_ui(f"Error in {platform} scraping: {error}")
+            self.logger.error(
+                "%s scraper error: %s", platform, error,
+                exc_info=error if self.logger.isEnabledFor(logging.DEBUG) else None
             )
+            return
+        
+        results = task.result()
+        self._update_ui(
+            f"{platform} scraping completed.\n"
+            f"Found {results.get('profiles_found', 0)} profiles.\n"
+            f"Downloaded {results.get('images_downloaded', 0)} images.\n"
+            f"Detected {results.get('faces_detected', 0)} faces.\n"
+            f"Total runtime: {results.get('runtime_seconds', 0)/60:.1f} minutes"
+        )
+    
+    def _profile_scrapers_done(self, keys, future):
+        """Show the combined results once all selected profile scrapers finish."""
+        names = " and ".join(self.SCRAPER_CONFIGS[key][2] for key in keys)
+        try:
+            results = [r for r in future.result() if isinstance(r, dict)]
+            
+            # Update UI with the combined totals
+            self._pending_stats = (self._update_scrape_status, 
+                                   (sum(r.get('faces_detected', 0) for r in results),
+                                    sum(r.get('images_downloaded', 0) for r in results),
+                                    sum(r.get('profiles_found', 0) for r in results)))
             
         except Exception as e:
             # Report error
-            self._update_ui(f"Error in Instagram scraping: {str(e)}")
-            self.logger.error(f"Instagram scraper error: {e}", exc_info=True)
+            self._update_ui(f"Error in {names} scraping: {e}")
+            self.logger.error("%s scraper error: %s", names, e, exc_info=self.logger.isEnabledFor(logging.DEBUG))
         finally:
             # Clean up
-            if hasattr(self, 'update_id'):
-                self.dialog.after_cancel(self.update_id)
-            self._update_ui("Instagram scraping complete.")
-            self.dialog.after(0, self._instagram_scraping_complete)
+            self._update_ui(f"{names} scraping complete.")
+            self.dialog.after(0, self._profile_scraping_complete, names)
 
-    def _update_instagram_status(self, faces_count, images_count, profiles_count):
-        """Update the Instagram scraper status UI."""
-        self.faces_collected_label.config(text=str(faces_count))
-        self.images_processed_label.config(text=str(images_count))
-        self.sites_visited_label.config(text=str(profiles_count))
+    def _profile_scraping_complete(self, names):
+        """Update the UI when a profile scraping run is complete."""
+        # Apply final statistics before marking the progress bar complete
+        self._apply_pending_stats()
         
-        # Update progress based on target
-        progress = min(100, (faces_count / int(self.target_count_var.get())) * 100)
-        self.auto_progress_bar.stop()
-        self.auto_progress_bar.config(mode="determinate")
-        self.auto_progress_var.set(progress)
-
-    def _instagram_scraping_complete(self):
-        """Update the UI when Instagram scraping is complete."""
         self.auto_mode_running = False
-        self.instagram_button.config(state="normal")
+        for button in self._profile_scraper_buttons():
+            button.config(state="normal")
         self.auto_progress_bar.stop()
-        self.auto_progress_bar.config(value=100)
-        self.status_label.config(text="Instagram scraping complete")
+        self.auto_progress_var.set(100)
+        self.status_label.config(text=f"{names} scraping complete")
         
         # Refresh history
         self._load_history()
@@ -1672,9 +2257,74 @@ class ScraperDialog:
             )
             return
         
+        # Read the profiles file off the Tk thread, then build the window back on it
+        future = asyncio.run_coroutine_threadsafe(self._read_profiles(profiles_file), self._loop)
+        future.add_done_callback(lambda done: self._profiles_read_done(profiles_file, done))
+    
+    async def _read_profiles(self, profiles_file):
+        """Write out pending profiles, then load the profiles file in the default executor."""
+        await self._profile_writer.flush()
+        
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._load_profiles_file, profiles_file)
+    
+    @staticmethod
+    def _load_profiles_file(profiles_file):
+        """
+        Load the discovered profiles file.
+        
+        Args:
+            profiles_file (str): Path to the profiles JSON file.
+            
+        Returns:
+            dict: Parsed profiles data.
+        """
+        with open(profiles_file, 'rb') as f:
+            if orjson is None:
+                return json.loads(f.read())
+            
+            # Parse large files straight from a read-only mapping instead of a copied buffer
+            if os.fstat(f.fileno()).st_size > 1024 * 1024:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    view = memoryview(mapped)
+                    try:
+                        return orjson.loads(view)
+                    finally:
+                        view.release()
+            return orjson.loads(f.read())
+    
+    @staticmethod
+    def _open_folder(path):
+        """
+        Open a folder in the platform's file manager.
+        
+        Args:
+            path (str): Folder to open.
+        """
+        if sys.platform == 'win32':
+            os.startfile(path)
+        elif sys.platform == 'darwin':
+            subprocess.Popen(['open', path])
+        else:
+            subprocess.Popen(['xdg-open', path])
+    
+    async def _open_folder_async(self, path):
+        """Open a folder in the file manager from the default executor."""
+        loop = asyncio.get_running_loop()
+        try:
+            await loop.run_in_executor(None, self._open_folder, path)
+        except Exception as e:
+            self.logger.error(f"Error opening folder {path}: {e}")
+    
+    def _profiles_read_done(self, profiles_file, future):
+        """Hand the loaded profiles back to the Tk thread unless the dialog has closed."""
+        if not self._shutdown.is_set():
+            self.dialog.after(0, self._on_profiles_loaded, profiles_file, future)
+    
+    def _on_profiles_loaded(self, profiles_file, future):
+        """Display the discovered Instagram profiles once the file has been read."""
         try:
-            with open(profiles_file, 'r') as f:
-                data = json.load(f)
+            data = future.result()
                 
             if 'profiles' not in data or not data['profiles']:
                 messagebox.showinfo(
@@ -1707,22 +2357,25 @@ class ScraperDialog:
                     text=f"Last Updated: {data['last_updated']}"
                 ).pack(pady=5)
             
-            # Create a Text widget with scrollbar
+            # Create a list widget with scrollbar
             profile_frame = ttk.Frame(frame)
             profile_frame.pack(fill=tk.BOTH, expand=True, pady=10)
             
-            profile_text = tk.Text(profile_frame, wrap=tk.WORD, height=20, width=40)
-            profile_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+            # Listbox only renders visible rows, and the list variable fills it in one assignment.
+            # Keep a reference to the variable, since Tk unsets it once it's garbage collected.
+            self._profiles_var = tk.Variable(value=[f"@{profile}" for profile in data['profiles']])
+            profile_list = tk.Listbox(
+                profile_frame,
+                listvariable=self._profiles_var,
+                height=20,
+                width=40,
+                activestyle="none"
+            )
+            profile_list.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
             
-            scrollbar = ttk.Scrollbar(profile_frame, command=profile_text.yview)
+            scrollbar = ttk.Scrollbar(profile_frame, command=profile_list.yview)
             scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-            profile_text.config(yscrollcommand=scrollbar.set)
-            
-            # Insert profiles
-            for profile in data['profiles']:
-                profile_text.insert(tk.END, f"@{profile}\n")
-            
-            profile_text.config(state="disabled")  # Make read-only
+            profile_list.config(yscrollcommand=scrollbar.set)
             
             # Buttons
             button_frame = ttk.Frame(frame)
@@ -1737,7 +2390,10 @@ class ScraperDialog:
             ttk.Button(
                 button_frame,
                 text="Open File Location",
-                command=lambda: os.startfile(os.path.dirname(os.path.abspath(profiles_file)))
+                command=lambda: asyncio.run_coroutine_threadsafe(
+                    self._open_folder_async(os.path.dirname(os.path.abspath(profiles_file))),
+                    self._loop
+                )
             ).pack(side=tk.LEFT, padx=5)
         except Exception as e:
             self.logger.error(f"Error showing Instagram profiles: {e}")
@@ -1745,123 +2401,3 @@ class ScraperDialog:
                 "Error",
                 f"Failed to load Instagram profiles: {e}"
             )
-
-    def start_twitter_scraper(self):
-        """Start the Twitter profile discovery and scraping process."""
-        if self.auto_mode_running:
-            messagebox.showwarning(
-                "Process Running",
-                "Another automatic scraping process is already running. Please wait for it to complete."
-            )
-            return
-        
-        # Get input values
-        try:
-            profile_count = int(self.profile_count_var.get())
-            scrape_count = int(self.scrape_count_var.get())
-            images_per_profile = int(self.images_per_profile_var.get())
-            
-            if profile_count <= 0 or scrape_count <= 0 or images_per_profile <= 0:
-                raise ValueError("Values must be positive numbers")
-                
-            if scrape_count > profile_count:
-                scrape_count = profile_count
-                self.scrape_count_var.set(str(scrape_count))
-        except ValueError as e:
-            messagebox.showerror(
-                "Invalid Input",
-                f"Please enter valid settings: {str(e)}"
-            )
-            return
-        
-        # Prepare UI for scraping
-        self.auto_mode_running = True
-        self.twitter_button.config(state="disabled")
-        self.auto_progress_bar.config(mode="indeterminate")
-        self.auto_progress_bar.start(10)
-        self.status_label.config(text="Twitter scraping in progress...")
-        self.log("Starting Twitter profile discovery and scraping...")
-        
-        # Reset statistics
-        self.faces_collected_label.config(text="0")
-        self.images_processed_label.config(text="0")
-        self.sites_visited_label.config(text="0")
-        self.current_source_label.config(text="Twitter")
-        
-        # Initialize progress updater
-        self.start_time = time.time()
-        self.update_id = self.dialog.after(1000, self._update_elapsed_time)
-        
-        # Create and start the thread
-        twitter_thread = threading.Thread(
-            target=self._run_twitter_scraper,
-            args=(
-                profile_count,
-                scrape_count,
-                images_per_profile
-            )
-        )
-        twitter_thread.daemon = True
-        twitter_thread.start()
-
-    def _run_twitter_scraper(self, profile_count, scrape_count, images_per_profile):
-        """Run the Twitter scraper in a separate thread."""
-        try:
-            # Import the new Twitter controller
-            from scraper.twitter_controller import scrape_twitter_profiles
-            
-            # Run the scraper using asyncio
-            results = asyncio.run(scrape_twitter_profiles(
-                profile_count=profile_count,
-                max_profiles_to_scrape=scrape_count,
-                max_images_per_profile=images_per_profile
-            ))
-            
-            # Update UI with results
-            self.dialog.after(0, self._update_twitter_status, 
-                             results.get('faces_detected', 0),
-                             results.get('images_downloaded', 0),
-                             results.get('profiles_found', 0))
-            
-            # Report success
-            self._update_ui(
-                f"Twitter scraping completed.\n"
-                f"Found {results.get('profiles_found', 0)} profiles.\n"
-                f"Downloaded {results.get('images_downloaded', 0)} images.\n"
-                f"Detected {results.get('faces_detected', 0)} faces.\n"
-                f"Total runtime: {results.get('runtime_seconds', 0)/60:.1f} minutes"
-            )
-            
-        except Exception as e:
-            # Report error
-            self._update_ui(f"Error in Twitter scraping: {str(e)}")
-            self.logger.error(f"Twitter scraper error: {e}", exc_info=True)
-        finally:
-            # Clean up
-            if hasattr(self, 'update_id'):
-                self.dialog.after_cancel(self.update_id)
-            self._update_ui("Twitter scraping complete.")
-            self.dialog.after(0, self._twitter_scraping_complete)
-
-    def _update_twitter_status(self, faces_count, images_count, profiles_count):
-        """Update the Twitter scraper status UI."""
-        self.faces_collected_label.config(text=str(faces_count))
-        self.images_processed_label.config(text=str(images_count))
-        self.sites_visited_label.config(text=str(profiles_count))
-        
-        # Update progress based on target
-        progress = min(100, (faces_count / int(self.target_count_var.get())) * 100)
-        self.auto_progress_bar.stop()
-        self.auto_progress_bar.config(mode="determinate")
-        self.auto_progress_var.set(progress)
-
-    def _twitter_scraping_complete(self):
-        """Update the UI when Twitter scraping is complete."""
-        self.auto_mode_running = False
-        self.twitter_button.config(state="normal")
-        self.auto_progress_bar.stop()
-        self.auto_progress_bar.config(value=100)
-        self.status_label.config(text="Twitter scraping complete")
-        
-        # Refresh history
-        self._load_history()
\ No newline at end of file
@@ -1,7 +1,11 @@
 import tkinter as tk
 from tkinter import ttk
 from PIL import Image, ImageTk
+import cv2
+import numpy as np
+from collections import OrderedDict
 from utils.logger import get_logger
+from utils.config import Config
 import os
 
 class FaceMatcherView:
@@ -10,6 +14,15 @@ class FaceMatcherView:
     Handles UI rendering and user interaction.
     """
     
+    # Resampling filter used when scaling images to fit the canvases
+    RESAMPLE_FILTER = Image.LANCZOS
+    
+    # Pillow resampling filters accepted for the ResampleFilter setting
+    RESAMPLE_FILTERS = ('NEAREST', 'BOX', 'BILINEAR', 'HAMMING', 'BICUBIC', 'LANCZOS')
+    
+    # Number of fitted canvas images kept for revisiting images
+    IMAGE_CACHE_SIZE = 64
+    
     def __init__(self, root):
         """
         Initialize the view with the root Tk window.
@@ -21,9 +34,21 @@ class FaceMatcherView:
         self.root = root
         self.root.title("Face Matcher Application")
         
+        # Allow a cheaper resampling filter (e.g. BICUBIC, BILINEAR) to be configured
+        filter_name = Config().get('GUI', 'ResampleFilter', fallback=None)
+        if filter_name:
+            filter_name = filter_name.strip().upper()
+            if filter_name in self.RESAMPLE_FILTERS:
+                self.RESAMPLE_FILTER = getattr(Image, filter_name)
+            else:
+                self.logger.warning(f"Unknown resample filter '{filter_name}', using LANCZOS")
+        
         # Set minimum window size
         self.root.minsize(1200, 800)
         
+        # Recently displayed fitted images, keyed by (cache key, width, height), oldest first
+        self._image_cache = OrderedDict()
+        
         # Create frames for layout
         self._create_frames()
         
@@ -151,56 +176,75 @@ class FaceMatcherView:
         self.match_info_text.config(state='disabled')
     
     # Image display methods
-    def display_uploaded_image(self, image):
+    def display_uploaded_image(self, image, cache_key=None):
         """Display the uploaded image on the canvas."""
-        # Resize the image to fit the canvas
-        resized_image = self._resize_image(image, 400, 400)
-        
-        # Convert to PhotoImage
-        self.photo_uploaded = ImageTk.PhotoImage(resized_image)
-        
-        # Clear the canvas and display the image
-        self.canvas_uploaded.delete("all")
-        self.canvas_uploaded.create_image(0, 0, anchor='nw', image=self.photo_uploaded)
+        self.photo_uploaded = self._show_image(self.canvas_uploaded, image, cache_key)
     
-    def display_full_uploaded_image(self, image):
+    def display_full_uploaded_image(self, image, cache_key=None):
         """Display the full uploaded image on the canvas."""
-        # Resize the image to fit the canvas
-        resized_image = self._resize_image(image, 400, 400)
-        
-        # Convert to PhotoImage
-        self.photo_full_uploaded = ImageTk.PhotoImage(resized_image)
-        
-        # Clear the canvas and display the image
-        self.canvas_full_uploaded.delete("all")
-        self.canvas_full_uploaded.create_image(0, 0, anchor='nw', image=self.photo_full_uploaded)
+        self.photo_full_uploaded = self._show_image(self.canvas_full_uploaded, image, cache_key, area_downscale=True)
     
-    def display_matched_image(self, image):
+    def display_matched_image(self, image, cache_key=None):
         """Display the matched image on the canvas."""
-        # Resize the image to fit the canvas
-        resized_image = self._resize_image(image, 400, 400)
-        
-        # Convert to PhotoImage
-        self.photo_matched = ImageTk.PhotoImage(resized_image)
-        
-        # Clear the canvas and display the image
-        self.canvas_matched.delete("all")
-        self.canvas_matched.create_image(0, 0, anchor='nw', image=self.photo_matched)
+        self.photo_matched = self._show_image(self.canvas_matched, image, cache_key)
     
-    def display_full_matched_image(self, image):
+    def display_full_matched_image(self, image, cache_key=None):
         """Display the full matched image on the canvas."""
-        # Resize the image to fit the canvas
-        resized_image = self._resize_image(image, 400, 400)
+        self.photo_full_matched = self._show_image(self.canvas_full_matched, image, cache_key, area_downscale=True)
+    
+    def _show_image(self, canvas, image, cache_key=None, area_downscale=False):
+        """
+        Fit an image to a canvas and display it, reusing a cached fitted image when possible.
+        
+        Args:
+            canvas (tk.Canvas): Canvas to draw on.
+            image: PIL image, or a callable returning one. A callable is only
+                invoked on a cache miss, so the caller can skip loading the image.
+                Images returned by a callable are closed once they are fitted.
+            cache_key (hashable, optional): Identifies the image content (e.g. its
+                path and active overlays). Images without a key are not cached.
+            area_downscale (bool): Shrink large images with OpenCV's area
+                interpolation instead of the PIL filter (for full-size photos).
+                
+        Returns:
+            ImageTk.PhotoImage: The canvas's bitmap. The caller must keep a
+            reference to it, or Tk will drop the image.
+        """
+        key = None if cache_key is None else (cache_key, 400, 400)
+        fitted = self._image_cache.get(key) if key is not None else None
+        
+        if fitted is not None:
+            self._image_cache.move_to_end(key)
+        else:
+            owned = callable(image)
+            if owned:
+                image = image()
+            
+            # Resize the image to fit the canvas, padded to the full canvas size
+            # so that it covers whatever the bitmap showed before
+            fitted = Image.new('RGB', (400, 400), 'white')
+            try:
+                fitted.paste(self._resize_image(image, 400, 400, area_downscale))
+            finally:
+                # Only the fitted copy lives on; free the full-size buffer now
+                if owned:
+                    image.close()
+            
+            if key is not None:
+                self._image_cache[key] = fitted
+                if len(self._image_cache) > self.IMAGE_CACHE_SIZE:
+                    self._image_cache.popitem(last=False)
         
-        # Convert to PhotoImage
-        self.photo_full_matched = ImageTk.PhotoImage(resized_image)
+        # Write into the canvas's existing bitmap instead of allocating a new one
+        photo = self._canvas_photos[canvas]
+        photo.paste(fitted)
         
         # Clear the canvas and display the image
-        self.canvas_full_matched.delete("all")
-        self.canvas_full_matched.create_image(0, 0, anchor='nw', image=self.photo_full_matched)
+        canvas.delete("all")
+        canvas.create_image(0, 0, anchor='nw', image=photo)
+        return photo
     
-    @staticmethod
-    def _resize_image(image, width, height):
+    def _resize_image(self, image, width, height, area_downscale=False):
         """
         Resize an image to fit within the specified dimensions while maintaining aspect ratio.
         
@@ -208,6 +252,8 @@ class FaceMatcherView:
             image (PIL.Image): The image to resize.
             width (int): Target width.
             height (int): Target height.
+            area_downscale (bool): Use OpenCV's INTER_AREA when shrinking 8-bit
+                RGB/grayscale images.
             
         Returns:
             PIL.Image: Resized image.
@@ -224,8 +270,14 @@ class FaceMatcherView:
         new_width = int(original_width * scale_factor)
         new_height = int(original_height * scale_factor)
         
-        # Resize the image
-        return image.resize((new_width, new_height), Image.LANCZOS)
+        if area_downscale and scale_factor < 1 and image.mode in ('RGB', 'L'):
+            return Image.fromarray(
+                cv2.resize(np.asarray(image), (new_width, new_height), interpolation=cv2.INTER_AREA)
+            )
+        
+        # Resize the image; large reductions first box-reduce to within 2x of
+        # the target so the resampling filter runs on far fewer pixels
+        return image.resize((new_width, new_height), self.RESAMPLE_FILTER, reducing_gap=2.0)
     
     def _trigger_callback(self, callback_name):
         """
@@ -368,4 +420,11 @@ class FaceMatcherView:
         self.full_matched_image_label.pack(side='top', pady=5)
         
         self.canvas_full_matched = tk.Canvas(self.right_frame, width=400, height=400, bg='white')
-        self.canvas_full_matched.pack(side='top', pady=5)
\ No newline at end of file
+        self.canvas_full_matched.pack(side='top', pady=5)
+        
+        # One reusable bitmap per canvas; displayed images are pasted into it
+        self._canvas_photos = {
+            canvas: ImageTk.PhotoImage('RGB', (400, 400))
+            for canvas in (self.canvas_uploaded, self.canvas_full_uploaded,
+                           self.canvas_matched, self.canvas_full_matched)
+        }
\ No newline at end of file
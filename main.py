@@ -1,11 +1,13 @@
 import tkinter as tk
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from utils.logger import setup_logger
 from utils.config import Config
 from gui.model import FaceMatcherModel
 from gui.view import FaceMatcherView
 from gui.controller import FaceMatcherController
+from processing.face_db import DB_EXTENSIONS
 import logging
 
 def main():
@@ -34,6 +36,9 @@ def main():
     # Initialize Tkinter
     root = tk.Tk()
     
+    # Worker threads for face detection, so it doesn't block the Tk main loop
+    executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='face')
+    
     # Create MVC components
     try:
         # Create model
@@ -46,11 +51,12 @@ def main():
         logger.info(f"Checking database files...")
         db_path = config.get('Paths', 'DatabaseFolder')
         if os.path.exists(db_path):
-            db_files = [f for f in os.listdir(db_path) if f.endswith('.json')]
+            # One directory pass; DirEntry.stat() reuses data from the listing where possible
+            with os.scandir(db_path) as entries:
+                db_files = [(entry.name, entry.stat().st_size) for entry in entries
+                            if entry.name.endswith(DB_EXTENSIONS)]
             logger.info(f"Found {len(db_files)} database files")
-            for db_file in db_files:
-                file_path = os.path.join(db_path, db_file)
-                file_size = os.path.getsize(file_path)
+            for db_file, file_size in db_files:
                 logger.info(f"  {db_file}: {file_size} bytes")
         else:
             logger.warning(f"Database path does not exist: {db_path}")
@@ -62,7 +68,7 @@ def main():
         
         # Create controller
         logger.info("Initializing controller...")
-        controller = FaceMatcherController(model, view)
+        controller = FaceMatcherController(model, view, executor=executor)
         
         logger.info("MVC components initialized successfully")
     except Exception as e:
@@ -71,7 +77,10 @@ def main():
     
     # Start the application
     logger.info("Starting application main loop")
-    view.run()
+    try:
+        view.run()
+    finally:
+        executor.shutdown(wait=False)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,380 @@
+import os
+import json
+import re
+import sqlite3
+from functools import partial
+from processing.quantization import embedding_to_bytes, embedding_from_bytes
+
+try:
+    import orjson
+except ImportError:
+    # orjson is optional; fall back to the standard library
+    orjson = None
+
+
+# Database file extensions: JSON arrays (older batches), JSON Lines shards and SQLite
+DB_EXTENSIONS = ('.json', '.jsonl', '.sqlite3')
+
+# File name of the SQLite database within the database folder
+SQLITE_FILE = 'faces.sqlite3'
+
+# Record fields stored in their own SQLite columns; the rest go in the data column
+_SQLITE_COLUMNS = ('image_source', 'img_path', 'resolution', 'folder_name')
+
+# SQLite file in the database folder recording which image files have been processed
+MANIFEST_FILE = 'processed_images.db'
+
+_MANIFEST_SCHEMA = 'CREATE TABLE IF NOT EXISTS processed_images (key INTEGER PRIMARY KEY)'
+
+_SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS faces (
+    id INTEGER PRIMARY KEY,
+    image_source TEXT,
+    img_path TEXT,
+    resolution TEXT,
+    folder_name TEXT,
+    embedding BLOB,
+    embedding_format TEXT,
+    embedding_scale REAL,
+    data BLOB
+)
+"""
+
+# Size at which appends move on to a new JSON Lines shard
+MAX_SHARD_BYTES = 64 * 1024 * 1024
+
+# Block size for scanning JSON Lines files when counting records
+COUNT_BLOCK_BYTES = 1024 * 1024
+
+_SHARD_PATTERN = re.compile(r'^face_data_(\d+)\.jsonl$')
+
+# fdatasync is POSIX-only; Windows falls back to fsync
+_datasync = getattr(os, 'fdatasync', os.fsync)
+
+
+def dumps(data):
+    """
+    Serialize face data as compact JSON bytes.
+
+    numpy arrays in the data are serialized natively by orjson, and
+    converted to lists by the standard library fallback.
+
+    Args:
+        data: JSON-serializable face data.
+
+    Returns:
+        bytes: The encoded JSON.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(data, separators=(',', ':'), default=_to_json).encode('utf-8')
+
+
+def _to_json(obj):
+    """Convert numpy arrays and scalars for the standard library encoder."""
+    tolist = getattr(obj, 'tolist', None)
+    if tolist is None:
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+    return tolist()
+
+
+def sync_file(f):
+    """
+    Flush a file's data to disk.
+
+    Uses fdatasync where available, which skips the journal commit for
+    metadata such as timestamps that fsync would force.
+
+    Args:
+        f: Open file object; its Python buffer is flushed first.
+    """
+    f.flush()
+    _datasync(f.fileno())
+
+
+def _loads(data):
+    """Parse JSON from bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def list_db_files(db_folder):
+    """
+    List the face database files in a folder.
+
+    Args:
+        db_folder (str): Path to the database folder.
+
+    Returns:
+        list: File names of JSON and JSON Lines database files.
+    """
+    with os.scandir(db_folder) as entries:
+        return [entry.name for entry in entries if entry.name.endswith(DB_EXTENSIONS)]
+
+
+def iter_db_file(file_path):
+    """
+    Iterate over the face records in a database file.
+
+    JSON Lines files are streamed one record at a time; lines that fail to
+    parse (e.g. a write cut short by a crash) are skipped.
+
+    Args:
+        file_path (str): Path to a .json, .jsonl or .sqlite3 database file.
+
+    Yields:
+        dict: Face data records.
+    """
+    if file_path.endswith('.sqlite3'):
+        yield from _iter_sqlite(file_path)
+        return
+
+    with open(file_path, 'rb') as f:
+        if not file_path.endswith('.jsonl'):
+            yield from _loads(f.read())
+            return
+
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                yield _loads(line)
+            except ValueError:
+                continue
+
+
+def count_db_records(file_path):
+    """
+    Count the face records in a database file.
+
+    JSON Lines files are counted by scanning raw blocks for line breaks,
+    without splitting lines or parsing the records. Every record written by
+    ShardWriter ends with one, so a trailing line cut short by a crash is
+    not counted.
+
+    Args:
+        file_path (str): Path to a .json, .jsonl or .sqlite3 database file.
+
+    Returns:
+        int: Number of records.
+    """
+    if file_path.endswith('.sqlite3'):
+        conn = sqlite3.connect(file_path)
+        try:
+            return conn.execute('SELECT COUNT(*) FROM faces').fetchone()[0]
+        finally:
+            conn.close()
+
+    if not file_path.endswith('.jsonl'):
+        with open(file_path, 'rb') as f:
+            data = _loads(f.read())
+        if not isinstance(data, list):
+            raise ValueError(f"Invalid data format in {file_path}")
+        return len(data)
+
+    with open(file_path, 'rb', buffering=0) as f:
+        return sum(block.count(b'\n') for block in iter(partial(f.read, COUNT_BLOCK_BYTES), b''))
+
+
+class ShardWriter:
+    """
+    Appends face records to the JSON Lines shards of a database folder.
+
+    The current shard stays open between writes, so repeated saves don't
+    list the folder or reopen the file; each write is synced once.
+    """
+
+    def __init__(self, db_folder, max_bytes=MAX_SHARD_BYTES):
+        """
+        Initialize the writer; no file is opened until the first write.
+
+        Args:
+            db_folder (str): Path to the database folder.
+            max_bytes (int): Shard size at which to start a new file.
+        """
+        self.db_folder = db_folder
+        self.max_bytes = max_bytes
+        self._file = None
+        self._shard = None
+
+    def write(self, records):
+        """
+        Append records to the current shard and sync them to disk.
+
+        A new shard is started once the current one reaches max_bytes.
+
+        Args:
+            records (list): JSON-serializable face data records.
+
+        Returns:
+            str: Path of the shard that was written.
+        """
+        if self._file is None or self._file.tell() >= self.max_bytes:
+            self._open_next_shard()
+
+        self._file.write(b''.join(dumps(record) + b'\n' for record in records))
+        sync_file(self._file)
+        return self._file.name
+
+    def close(self):
+        """Close the current shard."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _open_next_shard(self):
+        """Open the shard to append to: the folder's latest, or the one after it once full."""
+        if self._shard is None:
+            shard_numbers = [
+                int(match.group(1))
+                for match in map(_SHARD_PATTERN.match, os.listdir(self.db_folder))
+                if match
+            ]
+            self._shard = max(shard_numbers, default=0)
+        else:
+            self._shard += 1
+
+        self.close()
+        file_path = os.path.join(self.db_folder, f'face_data_{self._shard}.jsonl')
+        if os.path.exists(file_path) and os.path.getsize(file_path) >= self.max_bytes:
+            self._shard += 1
+            file_path = os.path.join(self.db_folder, f'face_data_{self._shard}.jsonl')
+        self._file = open(file_path, 'ab')
+
+
+def iter_image_sources(file_path):
+    """
+    Iterate over the source image paths of the faces in a database file.
+
+    SQLite databases are read from their image_source column alone.
+
+    Args:
+        file_path (str): Path to a database file.
+
+    Yields:
+        str: Source image path of each face that has one.
+    """
+    if not file_path.endswith('.sqlite3'):
+        for record in iter_db_file(file_path):
+            if record.get('image_source'):
+                yield record['image_source']
+        return
+
+    conn = sqlite3.connect(file_path)
+    try:
+        for (image_source,) in conn.execute('SELECT image_source FROM faces WHERE image_source IS NOT NULL'):
+            yield image_source
+    finally:
+        conn.close()
+
+
+def connect_sqlite(db_folder):
+    """
+    Open the SQLite face database in a folder, creating it if needed.
+
+    The connection is in autocommit mode with write-ahead logging, so
+    readers are not blocked by a batch being inserted.
+
+    Args:
+        db_folder (str): Path to the database folder.
+
+    Returns:
+        sqlite3.Connection: Connection usable from any one thread at a time.
+    """
+    conn = sqlite3.connect(
+        os.path.join(db_folder, SQLITE_FILE), isolation_level=None, check_same_thread=False
+    )
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    conn.execute(_SQLITE_SCHEMA)
+    return conn
+
+
+def insert_records(conn, records, embedding_format='int8'):
+    """
+    Insert face records into the SQLite database in one transaction.
+
+    Embeddings are stored as raw bytes in the given format rather than as
+    JSON; the remaining fields are stored as compact JSON.
+
+    Args:
+        conn (sqlite3.Connection): Connection from connect_sqlite.
+        records (list): Face data records with a 'face_embedding' entry.
+        embedding_format (str): 'int8', 'float16' or 'float32'.
+    """
+    rows = []
+    for record in records:
+        record = dict(record)
+        embedding = record.pop('face_embedding', None)
+        blob, scale = (None, None) if embedding is None else embedding_to_bytes(embedding, embedding_format)
+        columns = [record.pop(name, None) for name in _SQLITE_COLUMNS]
+        rows.append((*columns, blob, embedding_format if blob is not None else None, scale, dumps(record)))
+
+    conn.execute('BEGIN')
+    try:
+        conn.executemany(
+            'INSERT INTO faces (image_source, img_path, resolution, folder_name, '
+            'embedding, embedding_format, embedding_scale, data) VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+            rows
+        )
+        conn.execute('COMMIT')
+    except BaseException:
+        conn.execute('ROLLBACK')
+        raise
+
+
+def _iter_sqlite(file_path):
+    """Iterate over the face records in a SQLite database."""
+    conn = sqlite3.connect(file_path)
+    try:
+        rows = conn.execute(
+            'SELECT image_source, img_path, resolution, folder_name, '
+            'embedding, embedding_format, embedding_scale, data FROM faces ORDER BY id'
+        )
+        for *columns, blob, embedding_format, scale, data in rows:
+            record = _loads(data) if data else {}
+            record.update((name, value) for name, value in zip(_SQLITE_COLUMNS, columns) if value is not None)
+            if blob is not None:
+                record['face_embedding'] = embedding_from_bytes(blob, embedding_format, scale)
+            yield record
+    finally:
+        conn.close()
+
+
+def load_manifest(db_folder):
+    """
+    Load the keys of the image files recorded as processed in a database folder.
+
+    Args:
+        db_folder (str): Path to the database folder.
+
+    Returns:
+        set: Recorded keys; empty if there is no manifest yet.
+    """
+    file_path = os.path.join(db_folder, MANIFEST_FILE)
+    if not os.path.exists(file_path):
+        return set()
+
+    conn = sqlite3.connect(file_path)
+    try:
+        return {key for (key,) in conn.execute('SELECT key FROM processed_images')}
+    finally:
+        conn.close()
+
+
+def add_to_manifest(db_folder, keys):
+    """
+    Record image file keys as processed in a database folder's manifest.
+
+    Args:
+        db_folder (str): Path to the database folder.
+        keys (iterable): Signed 64-bit integer keys.
+    """
+    conn = sqlite3.connect(os.path.join(db_folder, MANIFEST_FILE))
+    try:
+        conn.execute(_MANIFEST_SCHEMA)
+        with conn:
+            conn.executemany('INSERT OR IGNORE INTO processed_images (key) VALUES (?)', ((key,) for key in keys))
+    finally:
+        conn.close()
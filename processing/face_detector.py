@@ -2,10 +2,22 @@ import cv2
 import numpy as np
 import insightface
 from insightface.app import FaceAnalysis
+from insightface.app.common import Face
+from insightface.utils import face_align
+from insightface.model_zoo.scrfd import distance2bbox, distance2kps
 import os
+import threading
+from dataclasses import dataclass
+from processing.postproc import argmax_area
 from utils.config import Config
 from utils.logger import get_logger
 
+try:
+    from turbojpeg import TurboJPEG, TJPF_BGR
+except ImportError:
+    # PyTurboJPEG is optional; JPEGs are decoded with OpenCV instead
+    TurboJPEG = None
+
 class FaceDetectionError(Exception):
     """Base exception for face detection errors."""
     pass
@@ -18,6 +30,60 @@ class ImageReadError(FaceDetectionError):
     """Exception raised when an image cannot be read."""
     pass
 
+@dataclass
+class FaceInfo:
+    """Information extracted from a detected face."""
+    
+    __slots__ = ('bbox', 'age', 'gender', 'pose', 'landmark_3d_68', 'landmark_2d_106', 'face_embedding')
+    
+    bbox: object
+    age: float
+    gender: str
+    pose: object
+    landmark_3d_68: object
+    landmark_2d_106: object
+    face_embedding: object
+    
+    def to_dict(self):
+        """
+        Convert to a face data dictionary for the database.
+        
+        Landmarks and the embedding are omitted when unavailable.
+        
+        Returns:
+            dict: Dictionary with face information.
+        """
+        optional = ('landmark_3d_68', 'landmark_2d_106', 'face_embedding')
+        return {
+            name: getattr(self, name) for name in self.__slots__
+            if name not in optional or getattr(self, name) is not None
+        }
+
+# Initial size of the per-thread buffer that image files are read into
+READ_BUFFER_SIZE = 8 * 1024 * 1024
+
+# Decoder for libjpeg-turbo, created on first use (False if unavailable)
+_turbo_jpeg = None
+
+def _get_turbo_jpeg():
+    """Get the shared TurboJPEG decoder, or None if libjpeg-turbo can't be loaded."""
+    global _turbo_jpeg
+    if _turbo_jpeg is None:
+        try:
+            _turbo_jpeg = TurboJPEG() if TurboJPEG is not None else False
+        except Exception:
+            _turbo_jpeg = False
+    return _turbo_jpeg or None
+
+# Face count above which the largest-face search uses the compiled kernel
+LARGEST_FACE_JIT_MIN = 8
+
+# Color conversions to BGR keyed by channel count; 3-channel images need none
+BGR_CONVERSIONS = {
+    1: cv2.COLOR_GRAY2BGR,
+    4: cv2.COLOR_RGBA2BGR,
+}
+
 class FaceDetector:
     """
     Handles face detection and analysis using InsightFace.
@@ -36,15 +102,48 @@ class FaceDetector:
         self.det_size = self.config.get_detection_size()
         self.ctx_id = self.config.get_gpu_id()
         
+        # Reusable read buffers, one per thread since detection runs from worker pools
+        self._local = threading.local()
+        
+        # Compile (or load the cached) largest-face kernel now rather than on a group photo
+        argmax_area(np.zeros((1, 4), dtype=np.int32))
+        
         self.logger.info(f"Initializing face detector with det_size={self.det_size}, threshold={self.det_threshold}, ctx_id={self.ctx_id}")
         
-        try:
-            self.model = FaceAnalysis()
-            self.model.prepare(ctx_id=self.ctx_id, det_size=self.det_size, det_thresh=self.det_threshold)
-            self.logger.info("Face detection model initialized successfully")
-        except Exception as e:
-            self.logger.error(f"Failed to initialize face detection model: {e}")
-            raise ModelInitializationError(f"Failed to initialize face detection model: {e}")
+        # Prefer the CUDA execution provider when a GPU is configured; onnxruntime
+        # falls back to the next provider in the list if CUDA is unavailable.
+        if self.ctx_id >= 0:
+            self.providers = ['CUDAExecutionProvider', 'CPUExecutionProvider']
+        else:
+            self.providers = ['CPUExecutionProvider']
+        
+        # The model is loaded on first use, so startup doesn't wait for it
+        self._model = None
+        self._model_lock = threading.Lock()
+        
+        # Whether the detection model takes several images per forward pass, checked on first use
+        self._batched_detection = None
+    
+    @property
+    def model(self):
+        """
+        The InsightFace analyzer, created and prepared on first access.
+        
+        Raises:
+            ModelInitializationError: If the model fails to initialize.
+        """
+        if self._model is None:
+            with self._model_lock:
+                if self._model is None:
+                    try:
+                        model = FaceAnalysis(providers=self.providers)
+                        model.prepare(ctx_id=self.ctx_id, det_size=self.det_size, det_thresh=self.det_threshold)
+                        self._model = model
+                        self.logger.info("Face detection model initialized successfully")
+                    except Exception as e:
+                        self.logger.error(f"Failed to initialize face detection model: {e}")
+                        raise ModelInitializationError(f"Failed to initialize face detection model: {e}")
+        return self._model
     
     def read_image(self, image_path):
         """
@@ -60,44 +159,418 @@ class FaceDetector:
             ImageReadError: If the image cannot be read.
         """
         try:
-            image = cv2.imread(image_path)
+            # Read into a buffer reused across calls and decode from it, instead of
+            # having imread allocate and fill a fresh buffer for every image
+            with open(image_path, 'rb', buffering=0) as f:
+                size = os.fstat(f.fileno()).st_size
+                buffer = self._get_read_buffer(size)
+                view = memoryview(buffer)
+                read = 0
+                while read < size:
+                    count = f.readinto(view[read:size])
+                    if not count:
+                        break
+                    read += count
+                view.release()
+            
+            # Both decoders copy pixels into a new array, so the buffer is free to reuse afterwards
+            data = np.frombuffer(buffer, dtype=np.uint8, count=read)
+            image = self._decode_jpeg(data)
+            if image is None:
+                image = cv2.imdecode(data, cv2.IMREAD_COLOR)
             if image is None:
                 raise ImageReadError(f"Image could not be read: {image_path}")
             return image
+        except MemoryError:
+            raise
         except Exception as e:
             self.logger.error(f"Error reading image {image_path}: {e}")
             raise ImageReadError(f"Error reading image {image_path}: {e}")
     
-    def detect_faces(self, image):
+    def _decode_jpeg(self, data):
+        """
+        Decode a JPEG straight to BGR with libjpeg-turbo, if available.
+        
+        JPEGs with EXIF data are left to OpenCV, which applies the EXIF
+        orientation while decoding.
+        
+        Args:
+            data (numpy.ndarray): Encoded file contents.
+            
+        Returns:
+            numpy.ndarray: The BGR image, or None if it wasn't decoded here.
+        """
+        turbo = _get_turbo_jpeg()
+        if turbo is None or data[:2].tobytes() != b'\xff\xd8':
+            return None
+        # The APP1 EXIF segment, when present, is among the first header segments
+        if b'Exif\x00\x00' in data[:4096].tobytes():
+            return None
+        try:
+            return turbo.decode(data, pixel_format=TJPF_BGR)
+        except MemoryError:
+            raise
+        except Exception as e:
+            self.logger.debug(f"TurboJPEG decode failed, falling back to OpenCV: {e}")
+            return None
+    
+    def _get_read_buffer(self, size):
+        """
+        Get this thread's read buffer, growing it if it is smaller than size.
+        
+        Args:
+            size (int): Number of bytes needed.
+            
+        Returns:
+            bytearray: Buffer of at least size bytes.
+        """
+        buffer = getattr(self._local, 'read_buffer', None)
+        if buffer is None or len(buffer) < size:
+            buffer = bytearray(max(size, READ_BUFFER_SIZE))
+            self._local.read_buffer = buffer
+        return buffer
+    
+    @staticmethod
+    def _to_bgr(image):
+        """
+        Ensure an image is in BGR format for InsightFace.
+        
+        Args:
+            image (numpy.ndarray): Grayscale, BGR or RGBA image.
+            
+        Returns:
+            numpy.ndarray: BGR image; 3-channel input is returned unchanged.
+        """
+        code = BGR_CONVERSIONS.get(image.shape[2] if image.ndim == 3 else 1)
+        if code is None:
+            return image
+        return cv2.cvtColor(image, code)
+    
+    def _detect(self, image):
+        """
+        Run only the detection model on a BGR image.
+        
+        Args:
+            image (numpy.ndarray): BGR image.
+            
+        Returns:
+            list: Detected faces with bbox, kps and det_score set.
+        """
+        bboxes, kpss = self.model.det_model.detect(image, max_num=0, metric='default')
+        return self._make_faces(bboxes, kpss)
+    
+    @staticmethod
+    def _make_faces(bboxes, kpss):
+        """
+        Build Face objects from detector output.
+        
+        Args:
+            bboxes (numpy.ndarray): (N, 5) array of boxes with their scores.
+            kpss (numpy.ndarray): (N, 5, 2) keypoints, or None.
+            
+        Returns:
+            list: Detected faces with bbox, kps and det_score set.
+        """
+        faces = []
+        for i in range(bboxes.shape[0]):
+            face = Face(
+                bbox=bboxes[i, 0:4],
+                kps=kpss[i] if kpss is not None else None,
+                det_score=bboxes[i, 4]
+            )
+            face._bbox_int = face.bbox.astype(np.int32)
+            faces.append(face)
+        return faces
+    
+    def _supports_batched_detection(self):
+        """Check whether the detection model has a dynamic batch dimension."""
+        if self._batched_detection is None:
+            det_model = self.model.det_model
+            batch_dim = det_model.session.get_inputs()[0].shape[0]
+            self._batched_detection = bool(getattr(det_model, 'batched', False)) and not isinstance(batch_dim, int)
+        return self._batched_detection
+    
+    def _letterbox(self, image):
+        """
+        Fit an image into the detector input, padding bottom and right, as SCRFD does.
+        
+        Args:
+            image (numpy.ndarray): BGR image.
+            
+        Returns:
+            tuple: (det_image, det_scale) where det_scale maps image to input coordinates.
+        """
+        input_width, input_height = self.model.det_model.input_size
+        if image.shape[0] / image.shape[1] > input_height / input_width:
+            new_height = input_height
+            new_width = int(new_height * image.shape[1] / image.shape[0])
+        else:
+            new_width = input_width
+            new_height = int(new_width * image.shape[0] / image.shape[1])
+        
+        det_image = np.zeros((input_height, input_width, 3), dtype=np.uint8)
+        det_image[:new_height, :new_width] = cv2.resize(image, (new_width, new_height))
+        return det_image, new_height / image.shape[0]
+    
+    def _anchor_centers(self, height, width, stride):
+        """Get the anchor centers for one feature map, cached on the detection model."""
+        det_model = self.model.det_model
+        key = (height, width, stride)
+        anchor_centers = det_model.center_cache.get(key)
+        if anchor_centers is None:
+            anchor_centers = np.stack(np.mgrid[:height, :width][::-1], axis=-1).astype(np.float32)
+            anchor_centers = (anchor_centers * stride).reshape((-1, 2))
+            if det_model._num_anchors > 1:
+                anchor_centers = np.stack([anchor_centers] * det_model._num_anchors, axis=1).reshape((-1, 2))
+            if len(det_model.center_cache) < 100:
+                det_model.center_cache[key] = anchor_centers
+        return anchor_centers
+    
+    def _decode_detections(self, net_outs, index, det_scale):
+        """
+        Decode one image's detections from a batched detection model output.
+        
+        Mirrors SCRFD.forward and SCRFD.detect for batch entry index.
+        
+        Args:
+            net_outs (list): Outputs of the detection session.
+            index (int): Position of the image in the batch.
+            det_scale (float): Scale returned by _letterbox for the image.
+            
+        Returns:
+            list: Detected faces with bbox, kps and det_score set.
+        """
+        det_model = self.model.det_model
+        input_width, input_height = det_model.input_size
+        fmc = det_model.fmc
+        scores_list, bboxes_list, kpss_list = [], [], []
+        
+        for idx, stride in enumerate(det_model._feat_stride_fpn):
+            scores = net_outs[idx][index]
+            anchor_centers = self._anchor_centers(input_height // stride, input_width // stride, stride)
+            pos_inds = np.where(scores >= det_model.det_thresh)[0]
+            scores_list.append(scores[pos_inds])
+            bboxes_list.append(distance2bbox(anchor_centers, net_outs[idx + fmc][index] * stride)[pos_inds])
+            if det_model.use_kps:
+                kpss = distance2kps(anchor_centers, net_outs[idx + fmc * 2][index] * stride)
+                kpss_list.append(kpss.reshape((kpss.shape[0], -1, 2))[pos_inds])
+        
+        scores = np.vstack(scores_list)
+        order = scores.ravel().argsort()[::-1]
+        pre_det = np.hstack((np.vstack(bboxes_list) / det_scale, scores)).astype(np.float32, copy=False)
+        pre_det = pre_det[order, :]
+        keep = det_model.nms(pre_det)
+        kpss = np.vstack(kpss_list)[order][keep] / det_scale if det_model.use_kps else None
+        return self._make_faces(pre_det[keep, :], kpss)
+    
+    def _detect_batch(self, images):
+        """
+        Run only the detection model on several BGR images.
+        
+        When the detection model has a dynamic batch dimension, the images are
+        letterboxed to the detection size and run in a single forward pass;
+        otherwise, or if that fails, they are detected one at a time.
+        
+        Args:
+            images (list): BGR images.
+            
+        Returns:
+            list: Detected faces for each image, in order.
+        """
+        if len(images) > 1 and self._supports_batched_detection():
+            try:
+                det_model = self.model.det_model
+                letterboxed = [self._letterbox(image) for image in images]
+                blob = cv2.dnn.blobFromImages(
+                    [det_image for det_image, _ in letterboxed],
+                    1.0 / det_model.input_std,
+                    tuple(det_model.input_size),
+                    (det_model.input_mean,) * 3,
+                    swapRB=True
+                )
+                net_outs = det_model.session.run(det_model.output_names, {det_model.input_name: blob})
+                return [
+                    self._decode_detections(net_outs, index, det_scale)
+                    for index, (_, det_scale) in enumerate(letterboxed)
+                ]
+            except MemoryError:
+                raise
+            except Exception as e:
+                self.logger.warning(f"Batched detection failed, detecting images one at a time: {e}")
+        return [self._detect(image) for image in images]
+    
+    def _analyze(self, image, faces=None):
+        """
+        Run detection and the landmark/attribute models, but not recognition.
+        
+        Args:
+            image (numpy.ndarray): BGR image.
+            faces (list, optional): Faces already found by the detection model.
+            
+        Returns:
+            list: Detected faces without embeddings.
+        """
+        if faces is None:
+            faces = self._detect(image)
+        for face in faces:
+            for taskname, model in self.model.models.items():
+                if taskname not in ('detection', 'recognition'):
+                    model.get(image, face)
+        return faces
+    
+    def detect_faces(self, image, detail='full'):
         """
         Detect faces in an image.
         
         Args:
             image (numpy.ndarray): Image as a numpy array.
+            detail (str): 'full' to run every analysis model (landmarks,
+                age/gender, embedding), 'attributes' to skip only the embedding
+                (see embed_faces), or 'det_only' to run only the detector when
+                just bounding boxes and keypoints are needed.
             
         Returns:
             list: List of detected faces.
         """
         try:
-            # Ensure image is in BGR format for InsightFace
-            if len(image.shape) == 2:  # Grayscale
-                image = cv2.cvtColor(image, cv2.COLOR_GRAY2BGR)
-            elif image.shape[2] == 4:  # RGBA
-                image = cv2.cvtColor(image, cv2.COLOR_RGBA2BGR)
-                
-            faces = self.model.get(image)
+            image = self._to_bgr(image)
+            if detail == 'det_only':
+                faces = self._detect(image)
+            elif detail == 'attributes':
+                faces = self._analyze(image)
+            else:
+                faces = self.model.get(image)
+                for face in faces:
+                    face._bbox_int = face.bbox.astype(np.int32)
             self.logger.debug(f"Detected {len(faces)} faces")
             return faces
         except Exception as e:
             self.logger.error(f"Error detecting faces: {e}")
             return []
     
-    def process_image(self, image_path):
+    def align_face(self, image, face):
+        """
+        Get the aligned crop of a face that the recognition model expects.
+        
+        Args:
+            image (numpy.ndarray): BGR image the face was detected in.
+            face (object): Detected face.
+            
+        Returns:
+            numpy.ndarray: Aligned face crop, or None if the face has no keypoints
+            or no recognition model is loaded.
+        """
+        recognition = self.model.models.get('recognition')
+        if recognition is None or face.kps is None:
+            return None
+        return face_align.norm_crop(image, landmark=face.kps, image_size=recognition.input_size[0])
+    
+    def embed_faces(self, aligned_faces):
+        """
+        Compute embeddings for aligned face crops in a single recognition call.
+        
+        Args:
+            aligned_faces (list): Crops returned by align_face.
+            
+        Returns:
+            numpy.ndarray: (N, D) array of embeddings, in order.
+        """
+        if not aligned_faces:
+            return np.empty((0, 0), dtype=np.float32)
+        return self.model.models['recognition'].get_feat(aligned_faces)
+    
+    def detect_faces_batch(self, images, detail='full'):
+        """
+        Detect and analyse faces in several images, batching model calls.
+        
+        Detection runs in one forward pass when the detection model supports
+        batching, and the embeddings for every face found across all images
+        are computed in a single recognition model call. The landmark and
+        attribute models run per face.
+        
+        Args:
+            images (list): Images as numpy arrays.
+            detail (str): Analysis level, as for detect_faces.
+            
+        Returns:
+            list: List of detected faces for each image, in order.
+        """
+        results = [[] for _ in images]
+        aligned_faces = []
+        recognized = []
+        
+        try:
+            images = [self._to_bgr(image) for image in images]
+            detections = self._detect_batch(images)
+        except MemoryError:
+            raise
+        except Exception as e:
+            self.logger.error(f"Error detecting faces: {e}")
+            return results
+        
+        if detail == 'det_only':
+            return detections
+        
+        for index, (image, faces) in enumerate(zip(images, detections)):
+            try:
+                faces = self._analyze(image, faces)
+                if detail == 'full':
+                    for face in faces:
+                        # Queue the aligned crop for the batched recognition pass
+                        aligned = self.align_face(image, face)
+                        if aligned is not None:
+                            aligned_faces.append(aligned)
+                            recognized.append(face)
+                results[index] = faces
+            except MemoryError:
+                raise
+            except Exception as e:
+                self.logger.error(f"Error detecting faces: {e}")
+                results[index] = []
+        
+        if aligned_faces:
+            try:
+                embeddings = self.embed_faces(aligned_faces)
+                for face, embedding in zip(recognized, embeddings):
+                    face.embedding = embedding.flatten()
+            except MemoryError:
+                raise
+            except Exception as e:
+                self.logger.error(f"Error computing face embeddings: {e}")
+        
+        self.logger.debug(f"Detected {sum(len(faces) for faces in results)} faces in {len(images)} images")
+        return results
+    
+    def process_images(self, image_paths, detail='full'):
+        """
+        Process several image files, detecting faces in them as one batch.
+        
+        Args:
+            image_paths (list): Paths to the image files.
+            detail (str): Analysis level passed to detect_faces_batch.
+            
+        Returns:
+            list: (image, faces) for each path, in order, as from process_image.
+        """
+        images = []
+        for image_path in image_paths:
+            try:
+                images.append(self.read_image(image_path))
+            except ImageReadError as e:
+                self.logger.warning(f"Skipping image: {e}")
+                images.append(None)
+        
+        readable = [image for image in images if image is not None]
+        detections = iter(self.detect_faces_batch(readable, detail))
+        return [(image, next(detections)) if image is not None else (None, []) for image in images]
+    
+    def process_image(self, image_path, detail='full'):
         """
         Process an image file to detect faces and extract information.
         
         Args:
             image_path (str): Path to the image file.
+            detail (str): Analysis level passed to detect_faces.
             
         Returns:
             tuple: (image, faces) where image is the numpy array and
@@ -105,7 +578,7 @@ class FaceDetector:
         """
         try:
             image = self.read_image(image_path)
-            faces = self.detect_faces(image)
+            faces = self.detect_faces(image, detail)
             return image, faces
         except ImageReadError as e:
             self.logger.warning(f"Skipping image: {e}")
@@ -127,17 +600,28 @@ class FaceDetector:
         if not faces:
             return None
             
-        max_area = 0
-        largest_face = None
+        bboxes = np.stack([self._int_bbox(face) for face in faces])
+        if len(faces) > LARGEST_FACE_JIT_MIN:
+            return faces[argmax_area(bboxes)]
         
-        for face in faces:
-            bbox = face.bbox.astype(int)
-            area = (bbox[2] - bbox[0]) * (bbox[3] - bbox[1])
-            if area > max_area:
-                max_area = area
-                largest_face = face
-                
-        return largest_face
+        areas = (bboxes[:, 2] - bboxes[:, 0]) * (bboxes[:, 3] - bboxes[:, 1])
+        return faces[int(np.argmax(areas))]
+    
+    @staticmethod
+    def _int_bbox(face):
+        """
+        Get a face's bounding box as integers, reusing the copy made at detection.
+        
+        Args:
+            face (object): Detected face.
+            
+        Returns:
+            numpy.ndarray: Bounding box as [x1, y1, x2, y2] int32 values.
+        """
+        bbox = getattr(face, '_bbox_int', None)
+        if bbox is None:
+            bbox = face.bbox.astype(np.int32)
+        return bbox
     
     def crop_face(self, image, face, margin=0.1):
         """
@@ -155,7 +639,7 @@ class FaceDetector:
             return None
             
         h, w = image.shape[:2]
-        bbox = face.bbox.astype(int)
+        bbox = self._int_bbox(face)
         
         # Calculate margin in pixels
         x_margin = int((bbox[2] - bbox[0]) * margin)
@@ -171,32 +655,72 @@ class FaceDetector:
         cropped_face = image[top:bottom, left:right]
         return cropped_face
     
-    def extract_face_info(self, face, include_embedding=True):
+    def crop_faces(self, image, faces, margin=0.1):
+        """
+        Crop several faces from an image, computing all crop boxes at once.
+        
+        Uses the same margin and clipping as crop_face.
+        
+        Args:
+            image (numpy.ndarray): Image as a numpy array.
+            faces (list): Detected faces.
+            margin (float): Margin to add around each face (percentage of face size).
+            
+        Returns:
+            list: Cropped face views into the image, in order; empty arrays for
+            faces that fall outside the image.
+        """
+        if not faces:
+            return []
+        
+        h, w = image.shape[:2]
+        bboxes = np.stack([self._int_bbox(face) for face in faces])
+        
+        # Margins truncate toward zero like int(), then boxes are clipped to the image
+        margins = ((bboxes[:, 2:] - bboxes[:, :2]) * margin).astype(np.int32)
+        lefts, tops = np.maximum(bboxes[:, :2] - margins, 0).T.tolist()
+        rights, bottoms = np.clip(bboxes[:, 2:] + margins, 0, (w, h)).T.tolist()
+        
+        return [
+            image[top:bottom, left:right]
+            for left, top, right, bottom in zip(lefts, tops, rights, bottoms)
+        ]
+    
+    def extract_face_info(self, face, include_embedding=True, serialize='list'):
         """
         Extract information from a detected face.
         
         Args:
             face (object): Detected face.
             include_embedding (bool): Whether to include the face embedding.
+            serialize (str): How array fields are returned: 'list' for plain
+                Python lists, 'ndarray' for float32/int32 numpy arrays (for
+                orjson's OPT_SERIALIZE_NUMPY or np.savez), or 'bytes' for the
+                raw float32/int32 buffers.
             
         Returns:
-            dict: Dictionary with face information.
+            FaceInfo: Face information; use to_dict() for a database entry.
         """
-        info = {
-            'bbox': face.bbox.astype(int).tolist(),
-            'age': float(face.age),
-            'gender': 'Female' if face.gender < 0.5 else 'Male',
-            'pose': face.pose.tolist() if hasattr(face, 'pose') else None,
-        }
+        if serialize == 'list':
+            convert = lambda array, dtype: array.astype(dtype).tolist()
+        elif serialize == 'ndarray':
+            convert = lambda array, dtype: np.ascontiguousarray(array, dtype=dtype)
+        elif serialize == 'bytes':
+            convert = lambda array, dtype: np.ascontiguousarray(array, dtype=dtype).tobytes()
+        else:
+            raise ValueError(f"Unknown serialize mode: {serialize}")
         
-        # Include landmark information if available
-        if hasattr(face, 'landmark_3d_68'):
-            info['landmark_3d_68'] = face.landmark_3d_68.tolist()
-        if hasattr(face, 'landmark_2d_106'):
-            info['landmark_2d_106'] = face.landmark_2d_106.tolist()
-        
-        # Include embedding if requested
-        if include_embedding and hasattr(face, 'embedding'):
-            info['face_embedding'] = face.embedding.tolist()
-            
-        return info
+        return FaceInfo(
+            bbox=convert(self._int_bbox(face), np.int32),
+            age=float(face.age),
+            gender='Female' if face.gender < 0.5 else 'Male',
+            pose=convert(face.pose, np.float32) if hasattr(face, 'pose') else None,
+            # Include landmark information if available
+            landmark_3d_68=convert(face.landmark_3d_68, np.float32) if hasattr(face, 'landmark_3d_68') else None,
+            landmark_2d_106=convert(face.landmark_2d_106, np.float32) if hasattr(face, 'landmark_2d_106') else None,
+            # Include embedding if requested
+            face_embedding=(
+                convert(face.embedding, np.float32)
+                if include_embedding and hasattr(face, 'embedding') else None
+            )
+        )
@@ -1,14 +1,57 @@
 import os
-import json
+import asyncio
 import cv2
 import numpy as np
-from PIL import Image
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import random
+import shutil
+import threading
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, wait, FIRST_COMPLETED
+from itertools import chain, islice
+from functools import partial
 import tempfile
+import hashlib
 from utils.config import Config
 from utils.logger import get_logger
 from processing.face_detector import FaceDetector
+from processing.postproc import filter_faces_by_size
+from processing.quantization import compact_embedding
+from processing.face_db import (
+    list_db_files, iter_image_sources, count_db_records, ShardWriter, dumps, sync_file,
+    connect_sqlite, insert_records, SQLITE_FILE, load_manifest, add_to_manifest
+)
+
+# Encoder owned by each detection worker process
+_worker_encoder = None
+
+def _worker_context():
+    """
+    Get the multiprocessing context for detection worker processes.
+    
+    On POSIX, workers are forked from a forkserver that has already imported
+    this module (and with it OpenCV, InsightFace and onnxruntime), so starting a
+    worker skips the interpreter startup and imports. Windows only supports spawn.
+    """
+    if 'forkserver' not in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('spawn')
+    context = multiprocessing.get_context('forkserver')
+    context.set_forkserver_preload([__name__])
+    return context
+
+def _init_worker(img_folder, db_path, cropped_face_folder):
+    """Create the detection worker process's own encoder (and model)."""
+    global _worker_encoder
+    _worker_encoder = FaceEncoder(img_folder, db_path, cropped_face_folder)
+
+def _detect_and_crop_in_worker(img_paths):
+    """Run FaceEncoder._detect_and_crop_chunk in a detection worker process."""
+    # Array fields stay numpy arrays, which pickle as raw buffers instead of
+    # one object per number; the database writer serializes them directly
+    results = _worker_encoder._detect_and_crop_chunk(img_paths, serialize='ndarray', move=False)
+    # Worker processes exit without joining threads, so finish the crop writes here
+    _worker_encoder.flush_writes()
+    return results
 
 class FaceEncoder:
     """
@@ -21,7 +64,23 @@ class FaceEncoder:
     4. Saving the processed data to a database
     """
     
-    def __init__(self, img_folder=None, db_path=None, cropped_face_folder=None):
+    # Number of aligned faces passed to the recognition model per call
+    EMBED_BATCH_SIZE = 64
+    
+    # Largest number of images per worker task when the chunk size adapts upwards
+    MAX_CHUNK_SIZE = 64
+    
+    # Embedded faces saved to the database per flush, and the longest wait between flushes
+    DB_FLUSH_FACES = 1000
+    DB_FLUSH_INTERVAL = 30
+    
+    # JPEG quality of saved face crops
+    CROP_JPEG_QUALITY = 95
+    
+    # File extensions treated as images, matched case-insensitively
+    IMAGE_EXTENSIONS = frozenset({'png', 'jpg', 'jpeg', 'bmp'})
+    
+    def __init__(self, img_folder=None, db_path=None, cropped_face_folder=None, face_detector=None):
         """
         Initialize the FaceEncoder with paths from config if not provided.
         
@@ -29,6 +88,8 @@ class FaceEncoder:
             img_folder (str, optional): Folder containing images for processing.
             db_path (str, optional): Path to save the face database.
             cropped_face_folder (str, optional): Folder to save cropped faces.
+            face_detector (FaceDetector, optional): Pre-initialized detector to reuse.
+                A new detector is created if not provided.
         """
         self.logger = get_logger(__name__)
         self.config = Config()
@@ -45,8 +106,45 @@ class FaceEncoder:
         # Create necessary directories and check permissions
         self._initialize_directories()
         
-        # Initialize face detector
-        self.face_detector = FaceDetector()
+        # Reuse the provided face detector so the model is only loaded once
+        self.face_detector = face_detector or FaceDetector()
+        
+        # Normalized image_source paths already in the database, loaded on first use
+        self._processed_sources = None
+        
+        # Cropped faces are encoded and written on their own threads so detection
+        # doesn't wait on them; OpenCV releases the GIL while encoding
+        writer_threads = self.config.getint('FaceDetection', 'CropWriterThreads', fallback=0)
+        self._io_pool = ThreadPoolExecutor(
+            max_workers=writer_threads if writer_threads > 0 else min(4, os.cpu_count() or 1),
+            thread_name_prefix='crop-writer'
+        )
+        self._pending_writes = []
+        self._writes_lock = threading.Lock()
+        
+        # Storage format for embeddings in the database (int8, float16 or float32)
+        self.embedding_format = self.config.get('FaceMatching', 'EmbeddingFormat', fallback='int8').strip().lower()
+        
+        # Database storage for new faces (sqlite or jsonl); the connection or shard
+        # opens on first save and stays open between saves
+        self.db_format = self.config.get('Paths', 'DatabaseFormat', fallback='sqlite').strip().lower()
+        self._db_conn = None
+        self._shard_writer = None
+        
+        # Detection worker processes for CPU runs (0 runs detection on threads)
+        self.detection_processes = self.config.get_detection_processes()
+    
+    def set_img_folder(self, img_folder):
+        """
+        Point the encoder at a new input folder so it can be reused without reloading the model.
+        
+        Args:
+            img_folder (str): Folder containing images for processing.
+        """
+        self.img_folder = self._normalize_path(img_folder)
+        self.faces_folder = self._normalize_path(os.path.join(self.img_folder, "faces"))
+        self.no_faces_folder = self._normalize_path(os.path.join(self.img_folder, "no_faces"))
+        self._initialize_directories()
     
     def _normalize_path(self, path):
         """
@@ -119,25 +217,75 @@ class FaceEncoder:
         Returns:
             list: List of paths to image files.
         """
-        image_files = []
-        folder = self._normalize_path(folder)
+        image_files = list(self._iter_images(folder))
+        self.logger.info(f"Found {len(image_files)} image files in {folder}")
+        return image_files
+    
+    def _iter_images(self, folder):
+        """
+        Lazily walk a folder and its subfolders for image files.
         
-        excluded_dirs = {
+        Args:
+            folder (str): Folder to search for images.
+            
+        Yields:
+            str: Normalized path of each image file.
+        """
+        excluded_dirs = frozenset((
             self._normalize_path(self.cropped_face_folder),
             self._normalize_path(self.faces_folder),
             self._normalize_path(self.no_faces_folder)
-        }
+        ))
+        extensions = self.IMAGE_EXTENSIONS
+        
+        # Paths built from a normalized root are already normalized
+        stack = [self._normalize_path(folder)]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            # Skip excluded folders
+                            if entry.path not in excluded_dirs:
+                                stack.append(entry.path)
+                            continue
+                        
+                        _, dot, ext = entry.name.rpartition('.')
+                        if dot and (ext in extensions or ext.lower() in extensions):
+                            yield entry.path
+            except OSError as e:
+                self.logger.warning(f"Could not scan {e.filename}: {e}")
+    
+    @staticmethod
+    def _largest_first(img_paths, window):
+        """
+        Reorder image paths so larger files come first within each window.
+        
+        File size stands in for detection cost. Sorting each window rather than
+        the whole list keeps enumeration lazy, and the last window still ends
+        on its smallest images, so workers don't sit idle behind one slow
+        image at the end of a run.
         
-        for root, dirs, files in os.walk(folder):
-            # Skip excluded folders
-            dirs[:] = [d for d in dirs if self._normalize_path(os.path.join(root, d)) not in excluded_dirs]
+        Args:
+            img_paths (iterable): Image paths.
+            window (int): Number of paths sorted together.
             
-            for file in files:
-                if file.lower().endswith(('.png', '.jpg', '.jpeg', '.bmp')):
-                    image_files.append(self._normalize_path(os.path.join(root, file)))
-                    
-        self.logger.info(f"Found {len(image_files)} image files in {folder}")
-        return image_files
+        Yields:
+            str: Image paths.
+        """
+        def file_size(path):
+            try:
+                return os.path.getsize(path)
+            except OSError:
+                return 0
+        
+        img_paths = iter(img_paths)
+        while True:
+            block = list(islice(img_paths, window))
+            if not block:
+                return
+            block.sort(key=file_size, reverse=True)
+            yield from block
     
     def process_image(self, img_path):
         """
@@ -150,157 +298,417 @@ class FaceEncoder:
             tuple: (img_path, face_data_list) where face_data_list is a list of 
                   dictionaries containing face information.
         """
+        img_path, face_data_list, aligned_faces, _ = self._detect_and_crop(img_path)
+        self._embed_face_data(face_data_list, aligned_faces)
+        return img_path, face_data_list
+    
+    def _detect_and_crop(self, img_path, serialize='list', detection=None, move=True):
+        """
+        Detect faces in an image and save their crops, without computing embeddings.
+        
+        Args:
+            img_path (str): Path to the image file.
+            serialize (str): How array fields of the face data are returned;
+                see FaceDetector.extract_face_info.
+            detection (tuple, optional): (image, faces) already produced for
+                this path by FaceDetector.process_images.
+            move (bool): Whether to move the image to the faces or no_faces
+                folder now; otherwise the destination is returned for the
+                caller to move it (see _move_images).
+            
+        Returns:
+            tuple: (img_path, face_data_list, aligned_faces, destination) where
+                  aligned_faces holds the recognition input for each face data
+                  entry (None for faces that can't be aligned; pass both to
+                  _embed_face_data) and destination is where the image still
+                  has to be moved, or None.
+        """
         self.logger.debug(f"Processing image: {img_path}")
         face_data_list = []
+        aligned_faces = []
+        destination = None
+        file_name = os.path.basename(img_path)
         
         try:
-            # Use face detector to get the image and detect faces
-            image, faces = self.face_detector.process_image(img_path)
+            # Use face detector to get the image and detect faces; embeddings are
+            # computed later in batches
+            if detection is None:
+                detection = self.face_detector.process_image(img_path, detail='attributes')
+            image, faces = detection
             
             if image is None:
-                return img_path, []
+                return img_path, [], [], None
                 
             if faces:
+                # Shared by every face in the image
+                folder_name = os.path.basename(os.path.dirname(img_path))
+                file_stem = os.path.splitext(file_name)[0]
+                
+                # All crop boxes are computed in one pass; crops are views into the image
+                crops = self.face_detector.crop_faces(image, faces)
+                
                 # Process each detected face
-                for idx, face in enumerate(faces):
+                for idx, (face, cropped_face) in enumerate(zip(faces, crops)):
                     try:
                         # Get face information
-                        face_info = self.face_detector.extract_face_info(face)
+                        face_info = self.face_detector.extract_face_info(
+                            face, include_embedding=False, serialize=serialize
+                        )
                         
-                        # Crop the face image
-                        cropped_face = self.face_detector.crop_face(image, face)
-                        if cropped_face is None or cropped_face.size == 0:
+                        if cropped_face.size == 0:
                             continue
                             
-                        # Convert BGR to RGB for saving
-                        cropped_face_rgb = cv2.cvtColor(cropped_face, cv2.COLOR_BGR2RGB)
-                            
                         # Save the cropped face
-                        face_filename = f"{os.path.splitext(os.path.basename(img_path))[0]}_face_{idx}.jpg"
+                        face_filename = f"{file_stem}_face_{idx}.jpg"
                         cropped_face_path = os.path.join(self.cropped_face_folder, face_filename)
                         
-                        # Save using PIL to ensure correct color space
-                        pil_image = Image.fromarray(cropped_face_rgb)
-                        pil_image.save(cropped_face_path, quality=95)
-                        self.logger.debug(f"Saved cropped face: {cropped_face_path}")
+                        # The crop is copied out of the BGR image so queued writes don't keep
+                        # whole images alive; the writer pool encodes it
+                        future = self._io_pool.submit(self._write_jpeg, cropped_face_path, cropped_face.copy())
+                        with self._writes_lock:
+                            self._pending_writes.append(future)
                         
                         # Create face data entry
                         face_data = {
                             'image_source': img_path,
                             'img_path': cropped_face_path,
-                            **face_info,
-                            'resolution': f"{cropped_face_rgb.shape[1]}x{cropped_face_rgb.shape[0]} Pixels",
-                            'folder_name': os.path.basename(os.path.dirname(img_path))
+                            **face_info.to_dict(),
+                            'resolution': f"{cropped_face.shape[1]}x{cropped_face.shape[0]} Pixels",
+                            'folder_name': folder_name
                         }
                         
+                        aligned = self.face_detector.align_face(image, face)
                         face_data_list.append(face_data)
+                        aligned_faces.append(aligned)
+                    except MemoryError:
+                        raise
                     except Exception as e:
                         self.logger.error(f"Error processing face {idx} in {img_path}: {e}")
                 
-                # Move the processed image to faces folder
+                # The processed image goes to the faces folder
                 if face_data_list:
-                    try:
-                        os.rename(img_path, os.path.join(self.faces_folder, os.path.basename(img_path)))
-                        self.logger.debug(f"Moved {img_path} to faces folder")
-                    except OSError as e:
-                        self.logger.warning(f"Could not move {img_path} to faces folder: {e}")
+                    destination = os.path.join(self.faces_folder, file_name)
             else:
-                # No faces found, move to no_faces folder
-                try:
-                    os.rename(img_path, os.path.join(self.no_faces_folder, os.path.basename(img_path)))
-                    self.logger.debug(f"Moved {img_path} to no_faces folder (no faces detected)")
-                except OSError as e:
-                    self.logger.warning(f"Could not move {img_path} to no_faces folder: {e}")
+                # No faces found, the image goes to the no_faces folder
+                destination = os.path.join(self.no_faces_folder, file_name)
         
+        except MemoryError:
+            raise
         except Exception as e:
             self.logger.error(f"Error processing image {img_path}: {e}")
+        
+        if move and destination is not None:
+            self._move_images([(img_path, destination)])
+            destination = None
             
-        return img_path, face_data_list
+        return img_path, face_data_list, aligned_faces, destination
+    
+    def _move_images(self, moves):
+        """
+        Move processed images to their destination folders.
+        
+        Args:
+            moves (list): (img_path, destination) pairs.
+        """
+        for img_path, destination in moves:
+            try:
+                os.replace(img_path, destination)
+                self.logger.debug(f"Moved {img_path} to {os.path.dirname(destination)}")
+            except OSError as e:
+                self.logger.warning(f"Could not move {img_path} to {os.path.dirname(destination)}: {e}")
+    
+    def _detect_and_crop_chunk(self, img_paths, serialize='list', move=True):
+        """
+        Run _detect_and_crop over several images as one task, detecting
+        faces in all of them as one batch.
+        
+        Args:
+            img_paths (list): Paths to the image files.
+            serialize (str): Passed on to _detect_and_crop.
+            move (bool): Passed on to _detect_and_crop.
+            
+        Returns:
+            list: _detect_and_crop results, in order.
+        """
+        detections = self.face_detector.process_images(img_paths, detail='attributes')
+        return [
+            self._detect_and_crop(img_path, serialize, detection, move)
+            for img_path, detection in zip(img_paths, detections)
+        ]
+    
+    def _write_jpeg(self, file_path, image):
+        """
+        Encode an image as JPEG and write it to a file.
+        
+        Args:
+            file_path (str): Destination path.
+            image (numpy.ndarray): BGR image.
+            
+        Raises:
+            IOError: If the image cannot be encoded.
+        """
+        ok, encoded = cv2.imencode('.jpg', image, [cv2.IMWRITE_JPEG_QUALITY, self.CROP_JPEG_QUALITY])
+        if not ok:
+            raise IOError(f"Could not encode {file_path}")
+        with open(file_path, 'wb') as f:
+            f.write(encoded)
+        self.logger.debug(f"Saved cropped face: {file_path}")
+    
+    def flush_writes(self):
+        """Wait for queued cropped-face writes to finish, logging any failures."""
+        with self._writes_lock:
+            pending, self._pending_writes = self._pending_writes, []
+        for future in pending:
+            try:
+                future.result()
+            except Exception as e:
+                self.logger.error(f"Error saving cropped face: {e}")
+    
+    def close(self):
+        """Finish queued cropped-face writes and release the writer threads and database handles."""
+        self.flush_writes()
+        self._io_pool.shutdown(wait=True)
+        if self._db_conn is not None:
+            self._db_conn.close()
+            self._db_conn = None
+        if self._shard_writer is not None:
+            self._shard_writer.close()
+            self._shard_writer = None
+    
+    def _embed_face_data(self, face_data_list, aligned_faces):
+        """
+        Compute embeddings for face data entries in batched recognition calls.
+        
+        Args:
+            face_data_list (list): Face data dictionaries, updated in place with
+                a 'face_embedding' float32 array of unit length.
+            aligned_faces (list): Aligned crop for each entry, or None to skip it.
+        """
+        pending = ((face_data, aligned) for face_data, aligned in zip(face_data_list, aligned_faces)
+                   if aligned is not None)
+        
+        # Batches are drawn from the generator rather than sliced from a list,
+        # so the pairs are never materialized twice
+        while True:
+            chunk = list(islice(pending, self.EMBED_BATCH_SIZE))
+            if not chunk:
+                break
+            try:
+                # Embeddings stay float32 arrays: quantization reads them without a
+                # conversion, and orjson serializes them without boxing each float
+                embeddings = self.face_detector.embed_faces([aligned for _, aligned in chunk])
+                
+                # Unit length leaves cosine similarity unchanged, keeps float16 and int8
+                # storage within range, and lets a dot product stand in for cosine
+                norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+                embeddings = embeddings / np.maximum(norms, 1e-12)
+                for (face_data, _), embedding in zip(chunk, embeddings):
+                    face_data['face_embedding'] = embedding.astype(np.float32)
+            except Exception as e:
+                self.logger.error(f"Error computing face embeddings: {e}")
     
     def encode_faces(self, batch_size=250, max_workers=12):
         """
         Process all images in the input folder to detect and encode faces.
         
+        Images are fed to the workers continuously, keeping a fixed number in
+        flight, so a slow image never leaves the other workers idle. Faces are
+        embedded in batches and saved to the database in rolling flushes on a
+        writer thread, so embedding continues while a flush is written.
+        
         Args:
-            batch_size (int): Number of images to process in each batch.
-            max_workers (int): Maximum number of worker threads.
+            batch_size (int): Number of images between progress reports.
+            max_workers (int): Maximum number of worker threads. Ignored when
+                detection runs in worker processes (see DetectionProcesses).
             
         Returns:
             int: Number of faces processed.
         """
-        # Get all image files
-        self.logger.info(f"Looking for images in {self.img_folder} with batch size {batch_size}")
-        image_files = self.get_image_files(self.img_folder)
-        total_images = len(image_files)
+        # Enumerate images lazily so detection starts before the walk finishes
+        self.logger.info(f"Looking for images in {self.img_folder}")
+        image_files = self._iter_images(self.img_folder)
+        first_image = next(image_files, None)
         
-        if total_images == 0:
+        if first_image is None:
             self.logger.warning(f"No images found in {self.img_folder}")
             return 0
-            
-        # Process in batches
+        image_files = chain([first_image], image_files)
+        
+        # Images recorded as processed by an earlier run are skipped, e.g. ones
+        # whose move failed; the stat per image is only paid once there's a manifest
+        try:
+            recorded = load_manifest(self.db_path)
+        except Exception as e:
+            self.logger.warning(f"Could not read the processed-image manifest: {e}")
+            recorded = set()
+        if recorded:
+            self.logger.info(f"Loaded {len(recorded)} processed-image records; recorded images are skipped")
+            image_files = self._skip_recorded(image_files, recorded)
+        
+        total_images = 0
         total_faces = 0
-        batch_count = (total_images + batch_size - 1) // batch_size
         file_count = 0
         
-        # Cache for faster processing
-        self.logger.info(f"Processing {total_images} images in {batch_count} batches with {max_workers} workers")
-        import time
+        # Detection is CPU-bound without a GPU, so it can run in separate processes,
+        # each with its own model; embedding and database writes stay here
+        if self.detection_processes > 0 and self.face_detector.ctx_id < 0:
+            workers = self.detection_processes
+            # Each worker loads the model once in its initializer; onnxruntime sessions
+            # can't be inherited safely across fork
+            executor = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=_worker_context(),
+                initializer=_init_worker,
+                initargs=(self.img_folder, self.db_path, self.cropped_face_folder)
+            )
+            detect = _detect_and_crop_in_worker
+            self.logger.info(f"Processing images with {workers} worker processes")
+        else:
+            workers = max_workers
+            executor = ThreadPoolExecutor(max_workers=workers)
+            detect = partial(self._detect_and_crop_chunk, move=False)
+            self.logger.info(f"Processing images with {workers} workers")
+        
+        # Several images per task, so fast images don't pay the executor's per-task overhead.
+        # The chunk size adapts to throughput: it doubles while each report interval is
+        # faster than the last, halves after a slowdown, and halves and retries a chunk
+        # that ran out of memory
+        chunk_size = max(1, batch_size // (4 * workers))
+        max_chunk_size = max(chunk_size, self.MAX_CHUNK_SIZE)
+        growing = True
+        retry_paths = []
+        image_files = self._largest_first(image_files, max(batch_size, chunk_size * workers * 4))
         overall_start_time = time.time()
+        interval_start = overall_start_time
+        interval_images = 0
+        last_speed = 0.0
         
-        # Create face buffer to minimize database writes
+        # Faces awaiting embedding, and embedded faces awaiting the next database flush
+        face_buffer = []
+        aligned_buffer = []
         all_face_buffer = []
-        max_faces_before_save = 5000  # Save to database when buffer reaches this size
         
-        for batch_idx in range(batch_count):
-            start_idx = batch_idx * batch_size
-            end_idx = min(start_idx + batch_size, total_images)
-            current_batch = image_files[start_idx:end_idx]
-            
-            self.logger.info(f"Processing batch {batch_idx+1}/{batch_count} ({len(current_batch)} images)")
-            start_time = time.time()
-            
-            face_buffer = []
+        # Image moves held back until the images' faces are saved, so a failed
+        # save leaves them in place to be processed again
+        embed_moves = []
+        flush_moves = []
+        last_flush = time.monotonic()
+        next_report = batch_size
+        
+        # One flush is written at a time, in order; the next waits for it
+        db_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix='db-writer')
+        pending_save = None
+        
+        def submit_next():
+            if retry_paths:
+                img_paths = retry_paths[:chunk_size]
+                del retry_paths[:chunk_size]
+            else:
+                img_paths = list(islice(image_files, chunk_size))
+            if img_paths:
+                pending[executor.submit(detect, img_paths)] = img_paths
+        
+        def write_flush(face_data_list, count, moves):
+            # Crops go to disk before the records that point to them
+            self.flush_writes()
+            saved = self.save_to_database(face_data_list, count)
+            if saved > count:
+                self._finish_images(moves)
+            return saved
+        
+        try:
+            # Keep two chunks queued per worker so none waits between tasks
+            pending = {}
+            for _ in range(workers * 2):
+                submit_next()
             
-            # Process images in parallel
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                future_to_path = {executor.submit(self.process_image, img_path): img_path for img_path in current_batch}
-                
-                for future in as_completed(future_to_path):
-                    img_path = future_to_path[future]
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    img_paths = pending.pop(future)
+                    submit_next()
+                    total_images += len(img_paths)
                     try:
-                        _, face_data_list = future.result()
-                        if face_data_list:
-                            face_buffer.extend(face_data_list)
-                            all_face_buffer.extend(face_data_list)
-                            total_faces += len(face_data_list)
+                        for img_path, face_data_list, aligned_faces, destination in future.result():
+                            if face_data_list:
+                                face_buffer.extend(face_data_list)
+                                aligned_buffer.extend(aligned_faces)
+                                if destination is not None:
+                                    embed_moves.append((img_path, destination))
+                            elif destination is not None:
+                                flush_moves.append((img_path, destination))
+                    except MemoryError:
+                        if len(img_paths) == 1:
+                            self.logger.error(f"Out of memory processing {img_paths[0]}")
+                        else:
+                            chunk_size = max(1, min(chunk_size, len(img_paths)) // 2)
+                            growing = False
+                            self.logger.warning(f"Out of memory on {len(img_paths)} images, retrying them in chunks of {chunk_size}")
+                            total_images -= len(img_paths)
+                            retry_paths.extend(img_paths)
+                            submit_next()
                     except Exception as e:
-                        self.logger.error(f"Exception processing {img_path}: {e}")
-            
-            # Save to database if the accumulated buffer is large enough
-            if len(all_face_buffer) >= max_faces_before_save:
-                self.logger.info(f"Buffer reached {len(all_face_buffer)} faces, saving to database...")
-                file_count = self.save_to_database(all_face_buffer, file_count)
-                all_face_buffer = []  # Clear buffer after saving
-            
-            # Log processing time
-            end_time = time.time()
-            elapsed = end_time - start_time
-            speed = len(current_batch) / elapsed if elapsed > 0 else 0
-            faces_per_second = len(face_buffer) / elapsed if elapsed > 0 and face_buffer else 0
-            
-            self.logger.info(f"Batch {batch_idx+1} processed in {elapsed:.2f}s ({speed:.2f} images/s, {faces_per_second:.2f} faces/s)")
-            self.logger.info(f"Found {len(face_buffer)} faces in this batch, {total_faces} total so far")
+                        self.logger.error(f"Exception processing {len(img_paths)} images starting at {img_paths[0]}: {e}")
+                    
+                    if total_images >= next_report:
+                        next_report = total_images - total_images % batch_size + batch_size
+                        now = time.time()
+                        elapsed = now - overall_start_time
+                        speed = total_images / elapsed if elapsed > 0 else 0
+                        self.logger.info(f"Processed {total_images} images ({speed:.2f} images/s), {total_faces + len(face_buffer)} faces so far")
+                        
+                        # Adapt the chunk size to this interval's throughput
+                        interval_speed = (total_images - interval_images) / max(now - interval_start, 1e-6)
+                        if growing and interval_speed > 1.05 * last_speed and chunk_size < max_chunk_size:
+                            chunk_size = min(chunk_size * 2, max_chunk_size)
+                            self.logger.debug(f"Chunk size increased to {chunk_size}")
+                        elif interval_speed < 0.95 * last_speed and chunk_size > 1:
+                            chunk_size //= 2
+                            growing = False
+                            self.logger.debug(f"Chunk size decreased to {chunk_size}")
+                        last_speed = interval_speed
+                        interval_start = now
+                        interval_images = total_images
+                
+                # Embed once a full recognition batch has accumulated
+                if len(face_buffer) >= self.EMBED_BATCH_SIZE or (not pending and face_buffer):
+                    self._embed_face_data(face_buffer, aligned_buffer)
+                    all_face_buffer.extend(face_buffer)
+                    total_faces += len(face_buffer)
+                    face_buffer = []
+                    aligned_buffer = []
+                    flush_moves.extend(embed_moves)
+                    embed_moves = []
+                
+                # Save to database every DB_FLUSH_FACES faces or DB_FLUSH_INTERVAL seconds
+                if all_face_buffer and (len(all_face_buffer) >= self.DB_FLUSH_FACES
+                                        or time.monotonic() - last_flush >= self.DB_FLUSH_INTERVAL):
+                    if pending_save is not None:
+                        file_count = pending_save.result()
+                    pending_save = db_writer.submit(write_flush, all_face_buffer, file_count, flush_moves)
+                    all_face_buffer = []
+                    flush_moves = []
+                    last_flush = time.monotonic()
+        finally:
+            executor.shutdown()
+            db_writer.shutdown()
+            self.flush_writes()
+        
+        if pending_save is not None:
+            file_count = pending_save.result()
         
         # Save any remaining faces in buffer
         if all_face_buffer:
             self.logger.info(f"Saving remaining {len(all_face_buffer)} faces to database...")
-            file_count = self.save_to_database(all_face_buffer, file_count)
+            file_count = write_flush(all_face_buffer, file_count, flush_moves)
+        else:
+            self._finish_images(flush_moves)
         
         overall_elapsed = time.time() - overall_start_time
         overall_speed = total_images / overall_elapsed if overall_elapsed > 0 else 0
         overall_faces_per_second = total_faces / overall_elapsed if overall_elapsed > 0 and total_faces > 0 else 0
         
-        self.logger.info(f"All batches completed in {overall_elapsed:.2f}s")
+        self.logger.info(f"All images processed in {overall_elapsed:.2f}s")
         self.logger.info(f"Overall speed: {overall_speed:.2f} images/s, {overall_faces_per_second:.2f} faces/s")
         
         # Verify the entire database after processing
@@ -310,17 +718,36 @@ class FaceEncoder:
         self.logger.info(f"Processing complete. Encoded {total_faces} faces from {total_images} images")
         return total_faces
     
-    def save_to_database(self, face_buffer, file_count, max_faces_per_file=1000):
+    async def encode_faces_async(self, batch_size=250, max_workers=12):
         """
-        Save face data to JSON database files, with a maximum number of faces per file.
+        Run encode_faces without blocking the calling event loop.
+        
+        The pipeline runs on an executor thread with its own worker pools, so
+        the loop stays free for other work while images are encoded. The run
+        can't be interrupted once started; cancelling the await only stops
+        waiting for it.
+        
+        Args:
+            batch_size (int): Number of images between progress reports.
+            max_workers (int): Maximum number of worker threads.
+            
+        Returns:
+            int: Number of faces processed.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.encode_faces, batch_size, max_workers)
+    
+    def save_to_database(self, face_buffer, file_count):
+        """
+        Save face data to the SQLite database, or append it to the JSON Lines
+        shards when DatabaseFormat is jsonl.
         
         Args:
             face_buffer (list): List of face data dictionaries to save.
-            file_count (int): Current file count for naming.
-            max_faces_per_file (int): Maximum number of faces to store in a single file.
+            file_count (int): Number of database writes so far.
             
         Returns:
-            int: Updated file count.
+            int: Updated number of database writes.
         """
         if not face_buffer:
             self.logger.warning("No face data to save")
@@ -329,35 +756,25 @@ class FaceEncoder:
         # Ensure the database directory exists
         os.makedirs(self.db_path, exist_ok=True)
         
-        # Determine how many files we need
-        num_files = (len(face_buffer) + max_faces_per_file - 1) // max_faces_per_file
-        
-        for i in range(num_files):
-            start_idx = i * max_faces_per_file
-            end_idx = min(start_idx + max_faces_per_file, len(face_buffer))
-            batch = face_buffer[start_idx:end_idx]
-            
-            db_filename = f'face_data_batch_{file_count}.json'
-            db_file_path = os.path.join(self.db_path, db_filename)
-            
-            # Use atomic write pattern with temporary file
-            try:
-                import tempfile
-                with tempfile.NamedTemporaryFile('w', delete=False) as tmp_file:
-                    # Serialize the face data
-                    json.dump(batch, tmp_file, indent=2)
-                    tmp_file.flush()
-                    os.fsync(tmp_file.fileno())  # Ensure data is written to disk
-                    tmp_path = tmp_file.name
-                    
-                # Rename temp file to final filename (atomic operation)
-                import shutil
-                shutil.move(tmp_path, db_file_path)
-                
-                self.logger.info(f"Saved {len(batch)} faces to {db_file_path}")
-                file_count += 1
-            except Exception as e:
-                self.logger.error(f"Error saving faces to database: {e}")
+        try:
+            if self.db_format == 'sqlite':
+                # One transaction per batch, with embeddings stored as raw bytes
+                if self._db_conn is None:
+                    self._db_conn = connect_sqlite(self.db_path)
+                insert_records(self._db_conn, face_buffer, self.embedding_format)
+                db_file_path = os.path.join(self.db_path, SQLITE_FILE)
+            else:
+                # Store embeddings in the compact configured format
+                for face_data in face_buffer:
+                    compact_embedding(face_data, self.embedding_format)
+                if self._shard_writer is None:
+                    self._shard_writer = ShardWriter(self.db_path)
+                db_file_path = self._shard_writer.write(face_buffer)
+            self.logger.info(f"Saved {len(face_buffer)} faces to {db_file_path}")
+            self._mark_processed(face_buffer)
+            file_count += 1
+        except Exception as e:
+            self.logger.error(f"Error saving faces to database: {e}")
         
         return file_count
 
@@ -369,8 +786,6 @@ class FaceEncoder:
         Returns:
             dict: Statistics about the database verification.
         """
-        import random
-        
         stats = {
             'total_files': 0,
             'valid_files': 0,
@@ -382,7 +797,7 @@ class FaceEncoder:
             self.logger.warning(f"Database path does not exist: {self.db_path}")
             return stats
             
-        db_files = [f for f in os.listdir(self.db_path) if f.endswith('.json')]
+        db_files = list_db_files(self.db_path)
         stats['total_files'] = len(db_files)
         
         if not db_files:
@@ -398,16 +813,11 @@ class FaceEncoder:
         for db_file in sampled_files:
             db_file_path = os.path.join(self.db_path, db_file)
             try:
-                with open(db_file_path, 'r') as f:
-                    data = json.load(f)
-                    if isinstance(data, list):
-                        faces_count = len(data)
-                        stats['total_faces'] += faces_count
-                        stats['valid_files'] += 1
-                        self.logger.debug(f"Verified {db_file}: {faces_count} faces")
-                    else:
-                        stats['corrupted_files'] += 1
-                        self.logger.error(f"Invalid data format in {db_file}")
+                # JSON Lines shards are counted by line without parsing them
+                faces_count = count_db_records(db_file_path)
+                stats['total_faces'] += faces_count
+                stats['valid_files'] += 1
+                self.logger.debug(f"Verified {db_file}: {faces_count} faces")
             except Exception as e:
                 stats['corrupted_files'] += 1
                 self.logger.error(f"Error verifying {db_file}: {e}")
@@ -441,6 +851,10 @@ class FaceEncoder:
         # Collect all face data for batch saving
         face_data_buffer = []
         
+        # Read the database once up front instead of once per image
+        if skip_existing:
+            self._load_processed_index()
+        
         for img_path in image_files:
             try:
                 # Normalize path for Windows - convert all separators to system native
@@ -464,7 +878,7 @@ class FaceEncoder:
                 if face_data_list:
                     # Filter faces by size if needed
                     if min_face_size > 0:
-                        face_data_list = [f for f in face_data_list if self._check_face_size(f, min_face_size)]
+                        face_data_list = filter_faces_by_size(face_data_list, min_face_size)
                     
                     # Normalize paths in face data
                     for face_data in face_data_list:
@@ -502,7 +916,6 @@ class FaceEncoder:
                             
                             # Copy first, then remove original
                             try:
-                                import shutil
                                 shutil.copy2(img_path, dest_path)
                                 if os.path.exists(dest_path):  # Verify copy succeeded
                                     try:
@@ -517,33 +930,31 @@ class FaceEncoder:
                 self.logger.error(f"Error processing image {img_path}: {e}")
                 batch_stats['error_images'] += 1
         
-        # Save the collected face data to database
+        # Save the collected face data to database, once its crops are on disk
+        self.flush_writes()
         if face_data_buffer:
             try:
                 # Ensure database directory exists
                 os.makedirs(self.db_path, exist_ok=True)
                 
                 # Generate a timestamp-based filename
-                import time
                 timestamp = int(time.time())
                 db_filename = f"face_data_batch_{timestamp}.json"
                 db_file_path = os.path.normpath(os.path.join(self.db_path, db_filename))
                 
-                # Save using atomic write pattern
-                import tempfile
-                temp_dir = os.path.dirname(db_file_path)  # Use same directory as target
+                # Store embeddings in the compact configured format
+                for face_data in face_data_buffer:
+                    compact_embedding(face_data, self.embedding_format)
                 
-                with tempfile.NamedTemporaryFile('w', delete=False, dir=temp_dir, suffix='.json') as tmp_file:
-                    json.dump(face_data_buffer, tmp_file, indent=2)
-                    tmp_file.flush()
-                    os.fsync(tmp_file.fileno())
+                # Save using atomic write pattern; the temporary file is created in the
+                # database folder so the final rename never crosses filesystems
+                with tempfile.NamedTemporaryFile('wb', delete=False, dir=self.db_path, suffix='.json') as tmp_file:
+                    tmp_file.write(dumps(face_data_buffer))
+                    sync_file(tmp_file)
                     tmp_path = tmp_file.name
                 
-                # Rename temp file to final filename (atomic operation)
-                # If target exists, remove it first (Windows requirement)
-                if os.path.exists(db_file_path):
-                    os.remove(db_file_path)
-                os.rename(tmp_path, db_file_path)
+                # Rename temp file to final filename (atomic, and replaces an existing file on Windows too)
+                os.replace(tmp_path, db_file_path)
                 
                 self.logger.info(f"Saved {len(face_data_buffer)} faces to {db_file_path}")
                 
@@ -551,47 +962,143 @@ class FaceEncoder:
                 if not self._verify_database_file(db_file_path, len(face_data_buffer)):
                     self.logger.error(f"Database file verification failed: {db_file_path}")
                     batch_stats['faces_added'] = 0
+                else:
+                    self._mark_processed(face_data_buffer)
             except Exception as e:
                 self.logger.error(f"Error saving face data to database: {e}")
                 batch_stats['faces_added'] = 0
         
         return batch_stats
         
+    def _path_key(self, path):
+        """
+        Get the compact key under which an image path is kept in the processed index.
+        
+        A 64-bit digest of the normalized path takes a fraction of the memory of
+        the path string, and collisions are negligible at any realistic size.
+        
+        Args:
+            path (str): Image path.
+            
+        Returns:
+            int: 64-bit key for the path.
+        """
+        digest = hashlib.blake2b(
+            self._normalize_path(path).encode('utf-8', 'surrogateescape'), digest_size=8
+        ).digest()
+        return int.from_bytes(digest, 'little')
+    
+    @staticmethod
+    def _file_key(path):
+        """
+        Get the manifest key of an image file from its device, inode, modification
+        time and size, which survive the move to the faces or no_faces folder.
+        
+        Args:
+            path (str): Image path.
+            
+        Returns:
+            int: Signed 64-bit key for the file as it is now.
+        """
+        st = os.stat(path)
+        digest = hashlib.blake2b(
+            f"{st.st_dev}:{st.st_ino}:{st.st_mtime_ns}:{st.st_size}".encode('ascii'), digest_size=8
+        ).digest()
+        return int.from_bytes(digest, 'little', signed=True)
+    
+    def _skip_recorded(self, img_paths, recorded):
+        """
+        Filter out image files recorded as processed in the manifest.
+        
+        Args:
+            img_paths (iterable): Image paths.
+            recorded (set): Keys from load_manifest.
+            
+        Yields:
+            str: Paths of images not processed yet.
+        """
+        for img_path in img_paths:
+            try:
+                if self._file_key(img_path) in recorded:
+                    self.logger.debug(f"Skipping already processed image: {img_path}")
+                    continue
+            except OSError:
+                pass
+            yield img_path
+    
+    def _finish_images(self, moves):
+        """
+        Record processed images in the manifest and move them to their folders.
+        
+        Args:
+            moves (list): (img_path, destination) pairs.
+        """
+        keys = []
+        for img_path, _ in moves:
+            try:
+                keys.append(self._file_key(img_path))
+            except OSError:
+                continue
+        
+        self._move_images(moves)
+        if keys:
+            try:
+                add_to_manifest(self.db_path, keys)
+            except Exception as e:
+                self.logger.warning(f"Could not record processed images in the manifest: {e}")
+    
+    def _load_processed_index(self):
+        """Read keys for the source image paths of all faces in the database into a set."""
+        processed = set()
+        try:
+            db_files = list_db_files(self.db_path)
+        except OSError:
+            db_files = []
+            
+        for db_file in db_files:
+            db_file_path = os.path.join(self.db_path, db_file)
+            try:
+                processed.update(map(self._path_key, iter_image_sources(db_file_path)))
+            except Exception:
+                continue
+        
+        self._processed_sources = processed
+        self.logger.debug(f"Indexed {len(processed)} processed images from {len(db_files)} database files")
+    
+    def _mark_processed(self, face_data_list):
+        """
+        Add the source images of newly saved faces to the processed index.
+        
+        Args:
+            face_data_list (list): Face data dictionaries that were saved.
+        """
+        if self._processed_sources is None:
+            return
+        self._processed_sources.update(
+            self._path_key(face['image_source']) for face in face_data_list if face.get('image_source')
+        )
+    
     def _is_face_in_database(self, img_path):
         """Check if an image has already been processed and exists in the database."""
         try:
-            img_path = self._normalize_path(img_path)
-            # Look for any database file containing this image path
-            for db_file in os.listdir(self.db_path):
-                if not db_file.endswith('.json'):
-                    continue
-                    
-                db_file_path = self._normalize_path(os.path.join(self.db_path, db_file))
-                try:
-                    with open(db_file_path, 'r') as f:
-                        data = json.load(f)
-                        if any(self._normalize_path(face['image_source']) == img_path for face in data):
-                            return True
-                except Exception:
-                    continue
-            return False
+            if self._processed_sources is None:
+                self._load_processed_index()
+            return self._path_key(img_path) in self._processed_sources
         except Exception:
             return False
             
     def _verify_database_file(self, db_file_path, expected_faces):
         """Verify that a database file was saved correctly."""
         try:
-            with open(db_file_path, 'r') as f:
-                data = json.load(f)
-                actual_faces = len(data)
-                if actual_faces != expected_faces:
-                    self.logger.warning(
-                        f"Database verification failed for {db_file_path}: "
-                        f"Expected {expected_faces} faces, found {actual_faces}"
-                    )
-                else:
-                    self.logger.info(f"Database file {db_file_path} verified successfully")
-                return actual_faces == expected_faces
+            actual_faces = count_db_records(db_file_path)
+            if actual_faces != expected_faces:
+                self.logger.warning(
+                    f"Database verification failed for {db_file_path}: "
+                    f"Expected {expected_faces} faces, found {actual_faces}"
+                )
+            else:
+                self.logger.info(f"Database file {db_file_path} verified successfully")
+            return actual_faces == expected_faces
         except Exception as e:
             self.logger.error(f"Error verifying database file {db_file_path}: {e}")
             return False
\ No newline at end of file
@@ -1,9 +1,10 @@
 import os
-import json
 import numpy as np
 from scipy.spatial import distance
 from scipy.spatial.distance import cosine
 import time
+from processing.face_db import list_db_files, iter_db_file
+from processing.quantization import dequantize_embedding
 from utils.config import Config
 from utils.logger import get_logger
 
@@ -49,7 +50,7 @@ class FaceMatcher:
             self.logger.warning(f"Database folder does not exist: {self.db_folder}")
             return
             
-        db_files = [f for f in os.listdir(self.db_folder) if f.endswith('.json')]
+        db_files = list_db_files(self.db_folder)
         
         if not db_files:
             self.logger.warning(f"No database files found in {self.db_folder}")
@@ -60,11 +61,11 @@ class FaceMatcher:
         for db_file in db_files:
             file_path = os.path.join(self.db_folder, db_file)
             try:
-                with open(file_path, 'r') as f:
-                    batch_data = json.load(f)
-                    self.face_db.extend(batch_data)
-                    self.logger.debug(f"Loaded {len(batch_data)} faces from {db_file}")
-            except json.JSONDecodeError as e:
+                # Decode compact (int8/float16) embeddings
+                batch_data = [dequantize_embedding(face_data) for face_data in iter_db_file(file_path)]
+                self.face_db.extend(batch_data)
+                self.logger.debug(f"Loaded {len(batch_data)} faces from {db_file}")
+            except ValueError as e:
                 self.logger.error(f"Error parsing JSON in {db_file}: {e}")
             except Exception as e:
                 self.logger.error(f"Error loading {db_file}: {e}")
@@ -83,9 +84,9 @@ class FaceMatcher:
         Returns:
             float: Cosine similarity value (1.0 is identical, 0.0 is completely different).
         """
-        # Convert to numpy arrays if they aren't already
-        v1_array = np.array(v1)
-        v2_array = np.array(v2)
+        # Convert to float32 arrays, upcasting half-precision embeddings
+        v1_array = np.asarray(v1, dtype=np.float32)
+        v2_array = np.asarray(v2, dtype=np.float32)
         
         # Calculate cosine similarity (1 - cosine distance)
         return 1 - cosine(v1_array, v2_array)
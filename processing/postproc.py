@@ -0,0 +1,84 @@
+import numpy as np
+from itertools import compress
+
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional; fall back to plain NumPy/Python execution
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+# No fastmath: its no-infs assumption would break the infinite boxes of faces without a bbox
+@njit(cache=True)
+def filter_bboxes(bboxes, min_size):
+    """
+    Compute a keep-mask for bounding boxes that meet a minimum size.
+
+    Args:
+        bboxes (numpy.ndarray): (N, 4) array of [x1, y1, x2, y2] boxes.
+        min_size (float): Minimum width and height in pixels.
+
+    Returns:
+        numpy.ndarray: Boolean mask of length N, True for boxes to keep.
+    """
+    n = bboxes.shape[0]
+    keep = np.empty(n, np.bool_)
+    for i in range(n):
+        w = bboxes[i, 2] - bboxes[i, 0]
+        h = bboxes[i, 3] - bboxes[i, 1]
+        keep[i] = (w >= min_size) and (h >= min_size)
+    return keep
+
+
+@njit(cache=True)
+def argmax_area(bboxes):
+    """
+    Find the index of the largest bounding box by area.
+
+    Ties go to the earliest box.
+
+    Args:
+        bboxes (numpy.ndarray): (N, 4) int32 array of [x1, y1, x2, y2] boxes, N > 0.
+
+    Returns:
+        int: Index of the box with the largest area.
+    """
+    best = 0
+    best_area = (bboxes[0, 2] - bboxes[0, 0]) * (bboxes[0, 3] - bboxes[0, 1])
+    for i in range(1, bboxes.shape[0]):
+        area = (bboxes[i, 2] - bboxes[i, 0]) * (bboxes[i, 3] - bboxes[i, 1])
+        if area > best_area:
+            best = i
+            best_area = area
+    return best
+
+
+def filter_faces_by_size(face_data_list, min_size):
+    """
+    Filter face data entries by the size of their bounding box.
+
+    Entries without a bounding box are kept.
+
+    Args:
+        face_data_list (list): List of face data dictionaries.
+        min_size (int): Minimum face width and height in pixels.
+
+    Returns:
+        list: Face data entries that meet the size requirement.
+    """
+    if not face_data_list or min_size <= 0:
+        return face_data_list
+
+    # Faces without a bbox get an infinite box so they always pass; bboxes
+    # may be lists or numpy arrays depending on how the faces were serialized
+    no_bbox = (0, 0, np.inf, np.inf)
+    bboxes = np.array(
+        [no_bbox if face.get('bbox') is None else np.asarray(face['bbox'])
+         for face in face_data_list],
+        dtype=np.float64
+    )
+    keep = filter_bboxes(bboxes, float(min_size))
+    return list(compress(face_data_list, keep))
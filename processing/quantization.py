@@ -0,0 +1,152 @@
+import base64
+import numpy as np
+
+
+def embedding_to_bytes(embedding, embedding_format='int8'):
+    """
+    Encode an embedding as raw bytes in a storage format.
+
+    int8 embeddings are scaled by their largest absolute component so that
+    they fit in [-127, 127]; the scale is needed to decode them.
+
+    Args:
+        embedding: Embedding as a list or numpy array.
+        embedding_format (str): 'int8', 'float16' or 'float32'.
+
+    Returns:
+        tuple: (data, scale) where data is bytes and scale is a float (1.0
+            for the float formats).
+    """
+    if embedding_format == 'int8':
+        embedding = np.asarray(embedding, dtype=np.float32)
+        scale = float(np.abs(embedding).max()) / 127.0
+        if scale == 0.0:
+            scale = 1.0
+        return np.round(embedding / scale).astype(np.int8).tobytes(), scale
+    if embedding_format == 'float16':
+        return np.asarray(embedding, dtype=np.float16).tobytes(), 1.0
+    if embedding_format == 'float32':
+        return np.asarray(embedding, dtype=np.float32).tobytes(), 1.0
+    raise ValueError(f"Unknown embedding format: {embedding_format}")
+
+
+def embedding_from_bytes(data, embedding_format, scale=1.0):
+    """
+    Decode an embedding encoded by embedding_to_bytes.
+
+    int8 embeddings are expanded to float32; float16 embeddings are kept at
+    half precision and upcast only when compared.
+
+    Args:
+        data (bytes): Encoded embedding.
+        embedding_format (str): 'int8', 'float16' or 'float32'.
+        scale (float): Scale returned when the embedding was encoded.
+
+    Returns:
+        numpy.ndarray: The embedding.
+    """
+    if embedding_format == 'int8':
+        return np.frombuffer(data, dtype=np.int8).astype(np.float32) * np.float32(scale)
+    if embedding_format == 'float16':
+        return np.frombuffer(data, dtype=np.float16)
+    if embedding_format == 'float32':
+        return np.frombuffer(data, dtype=np.float32)
+    raise ValueError(f"Unknown embedding format: {embedding_format}")
+
+
+def quantize_embedding(face_data):
+    """
+    Replace a face's FP32 embedding with an int8-quantized, base64-encoded copy.
+
+    The embedding is scaled by its largest absolute component so that it fits
+    in [-127, 127]; the scale is stored alongside it for dequantization.
+
+    Args:
+        face_data (dict): Face data dictionary with a 'face_embedding' entry.
+            Modified in place.
+
+    Returns:
+        dict: The same face data dictionary.
+    """
+    embedding = face_data.pop('face_embedding', None)
+    if embedding is None:
+        return face_data
+
+    data, scale = embedding_to_bytes(embedding, 'int8')
+    face_data['embedding_q8'] = base64.b64encode(data).decode('ascii')
+    face_data['embedding_scale'] = scale
+    return face_data
+
+
+def half_embedding(face_data):
+    """
+    Replace a face's FP32 embedding with a float16, base64-encoded copy.
+
+    Args:
+        face_data (dict): Face data dictionary with a 'face_embedding' entry.
+            Modified in place.
+
+    Returns:
+        dict: The same face data dictionary.
+    """
+    embedding = face_data.pop('face_embedding', None)
+    if embedding is None:
+        return face_data
+
+    data, _ = embedding_to_bytes(embedding, 'float16')
+    face_data['embedding_f16'] = base64.b64encode(data).decode('ascii')
+    return face_data
+
+
+# Encoders for the stored embedding formats; float32 keeps the plain list
+EMBEDDING_ENCODERS = {
+    'int8': quantize_embedding,
+    'float16': half_embedding,
+    'float32': lambda face_data: face_data,
+}
+
+
+def compact_embedding(face_data, embedding_format='int8'):
+    """
+    Encode a face's embedding in the given storage format.
+
+    Args:
+        face_data (dict): Face data dictionary, modified in place.
+        embedding_format (str): 'int8', 'float16' or 'float32'.
+
+    Returns:
+        dict: The same face data dictionary.
+    """
+    try:
+        encoder = EMBEDDING_ENCODERS[embedding_format]
+    except KeyError:
+        raise ValueError(f"Unknown embedding format: {embedding_format}")
+    return encoder(face_data)
+
+
+def dequantize_embedding(face_data):
+    """
+    Restore the 'face_embedding' of a face stored with a compact embedding.
+
+    int8 embeddings are expanded to float32; float16 embeddings are kept at
+    half precision and upcast only when compared. Faces that already carry a
+    plain 'face_embedding' are left untouched.
+
+    Args:
+        face_data (dict): Face data dictionary, modified in place.
+
+    Returns:
+        dict: The same face data dictionary.
+    """
+    encoded = face_data.pop('embedding_f16', None)
+    if encoded is not None:
+        face_data['face_embedding'] = embedding_from_bytes(base64.b64decode(encoded), 'float16')
+        return face_data
+
+    encoded = face_data.pop('embedding_q8', None)
+    if encoded is None:
+        return face_data
+
+    scale = face_data.pop('embedding_scale', 1.0)
+    face_data['face_embedding'] = embedding_from_bytes(base64.b64decode(encoded), 'int8', scale)
+    return face_data
@@ -13,11 +13,11 @@ class AutomaticPersonScraper:
     Automatic scraper focused on finding public photos of real people from social media.
     """
     
-    def __init__(self, db_path, download_dir, target_selector=None):
+    def __init__(self, db_path, download_dir, target_selector=None, session=None):
         self.logger = get_logger(__name__)
         self.target_selector = target_selector or SocialMediaTargetSelector()
-        self.crawler = SocialMediaCrawler()
-        self.downloader = ImageDownloader()
+        self.crawler = SocialMediaCrawler(session=session)
+        self.downloader = ImageDownloader(session=session)
         self.db_path = db_path
         self.download_dir = download_dir
         
@@ -152,26 +152,17 @@ class AutomaticPersonScraper:
                 # Import modules here to avoid circular imports
                 from processing.face_encoder import FaceEncoder
                 
-                # Create a custom FaceEncoder class that reuses the detector
-                class OptimizedFaceEncoder(FaceEncoder):
-                    def __init__(self, img_folder, db_path, cropped_face_folder, face_detector):
-                        super().__init__(img_folder, db_path, cropped_face_folder)
-                        # Replace the detector with our pre-initialized one
-                        if face_detector:
-                            self.face_detector = face_detector
-                            self.logger.info("Using pre-initialized face detector")
-                
-                # Create and cache the encoder
-                self.face_encoder = OptimizedFaceEncoder(
+                # Create and cache the encoder, reusing the pre-initialized detector
+                self.face_encoder = FaceEncoder(
                     img_folder=image_dir,
                     db_path=self.db_path,
                     cropped_face_folder=os.path.join(self.db_path, "../cropped_faces"),
                     face_detector=self.face_detector
                 )
-                self.logger.info("Created new optimized face encoder")
+                self.logger.info("Created new face encoder with shared detector")
             else:
                 # Update the image folder for the existing encoder
-                self.face_encoder.img_folder = image_dir
+                self.face_encoder.set_img_folder(image_dir)
                 self.logger.info("Reusing existing face encoder")
             
             # Process images in the directory with larger batch size and more workers
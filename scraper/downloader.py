@@ -1,9 +1,8 @@
 import os
 import asyncio
-import aiohttp
 import time
 import json
-from .utils import sanitize_filename, ensure_directory
+from .utils import sanitize_filename, ensure_directory, session_scope
 from utils.logger import get_logger
 from utils.config import Config
 from datetime import datetime
@@ -13,10 +12,16 @@ class ImageDownloader:
     Asynchronous image downloader to download images from URLs.
     """
     
-    def __init__(self):
-        """Initialize the image downloader with configuration settings."""
+    def __init__(self, session=None):
+        """
+        Initialize the image downloader with configuration settings.
+        
+        Args:
+            session (aiohttp.ClientSession, optional): Shared HTTP session to reuse.
+        """
         self.logger = get_logger(__name__)
         self.config = Config()
+        self.session = session
         
         # Load downloader settings from config
         self.headers = {
@@ -143,7 +148,7 @@ class ImageDownloader:
                 return await self.download_image(session, url, save_dir, downloaded_count, total_images, metadata)
         
         # Start downloads
-        async with aiohttp.ClientSession() as session:
+        async with session_scope(self.session) as session:
             tasks = [download_with_semaphore(url) for url in image_urls]
             results = await asyncio.gather(*tasks)
             
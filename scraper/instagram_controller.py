@@ -18,7 +18,10 @@ class InstagramScrapeController(PlatformScrapeController):
     def __init__(
         self, 
         profiles_file: str = "data/instagram_profiles.json", 
-        output_dir: str = "data/downloaded_images/instagram"
+        output_dir: str = "data/downloaded_images/instagram",
+        session=None,
+        semaphore=None,
+        profile_writer=None
     ):
         """
         Initialize the Instagram scrape controller.
@@ -26,12 +29,18 @@ class InstagramScrapeController(PlatformScrapeController):
         Args:
             profiles_file (str): Path to store discovered profiles
             output_dir (str): Directory to save downloaded images
+            session (aiohttp.ClientSession, optional): Shared HTTP session to reuse
+            semaphore (asyncio.Semaphore, optional): Limit on in-flight HTTP requests
+            profile_writer (ProfileWriter, optional): Shared writer for the profiles file
         """
         super().__init__(
             platform_name="Instagram", 
             profiles_file=profiles_file, 
-            output_dir=output_dir
+            output_dir=output_dir,
+            session=session,
+            profile_writer=profile_writer
         )
+        self.semaphore = semaphore
     
     async def find_profiles(
         self, 
@@ -51,7 +60,12 @@ class InstagramScrapeController(PlatformScrapeController):
         self.logger.info(f"Discovering Instagram profiles (target: {target_count})")
         
         # Use InstagramProfileFinder to discover profiles
-        finder = InstagramProfileFinder(output_file=self.profiles_file)
+        finder = InstagramProfileFinder(
+            output_file=self.profiles_file,
+            session=self.session,
+            semaphore=self.semaphore,
+            profile_writer=self.profile_writer
+        )
         profiles = await finder.run(
             target_count=target_count, 
             max_runtime_minutes=max_runtime_minutes
@@ -87,10 +101,14 @@ class InstagramScrapeController(PlatformScrapeController):
             profiles_file=self.profiles_file
         )
         
-        # Scrape images
-        images = scraper.run(
-            max_profiles=max_profiles, 
-            max_images_per_profile=max_images_per_profile
+        # Scrape images in a worker thread since Selenium blocks
+        loop = asyncio.get_event_loop()
+        images = await loop.run_in_executor(
+            None,
+            lambda: scraper.run(
+                max_profiles=max_profiles, 
+                max_images_per_profile=max_images_per_profile
+            )
         )
         
         self.logger.info(f"Downloaded {len(images)} images from Instagram")
@@ -100,7 +118,10 @@ class InstagramScrapeController(PlatformScrapeController):
 async def scrape_instagram_profiles(
     profile_count: int = 200, 
     max_profiles_to_scrape: int = 5, 
-    max_images_per_profile: int = 10
+    max_images_per_profile: int = 10,
+    session=None,
+    semaphore=None,
+    profile_writer=None
 ) -> dict:
     """
     Convenience function to run the full Instagram scraping pipeline.
@@ -109,11 +130,18 @@ async def scrape_instagram_profiles(
         profile_count (int): Number of profiles to discover
         max_profiles_to_scrape (int): Maximum profiles to scrape
         max_images_per_profile (int): Maximum images to download per profile
+        session (aiohttp.ClientSession, optional): Shared HTTP session to reuse
+        semaphore (asyncio.Semaphore, optional): Limit on in-flight HTTP requests
+        profile_writer (ProfileWriter, optional): Shared writer for the profiles file
     
     Returns:
         dict: Scraping process statistics
     """
-    controller = InstagramScrapeController()
+    controller = InstagramScrapeController(
+        session=session,
+        semaphore=semaphore,
+        profile_writer=profile_writer
+    )
     return await controller.run_full_pipeline(
         profile_count=profile_count,
         max_profiles_to_scrape=max_profiles_to_scrape,
@@ -1,5 +1,4 @@
 import asyncio
-import aiohttp
 import re
 import random
 import time
@@ -7,14 +6,23 @@ import os
 import json
 from bs4 import BeautifulSoup
 from utils.logger import get_logger
+from scraper.utils import session_scope, request_slot, save_json_atomic
 
 class InstagramProfileFinder:
     """Specialized crawler to find public Instagram profiles for scraping."""
     
-    def __init__(self, output_file="data/instagram_profiles.json"):
+    def __init__(self, output_file="data/instagram_profiles.json", session=None, semaphore=None,
+                 profile_writer=None):
         self.logger = get_logger(__name__)
         self.output_file = output_file
         
+        # Shared HTTP session and in-flight request limit, if provided by the caller
+        self.session = session
+        self.semaphore = semaphore
+        
+        # Shared writer for the profiles file, if provided by the caller
+        self.profile_writer = profile_writer
+        
         # User agent rotation for avoiding blocks
         self.user_agents = [
             'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/96.0.4664.110 Safari/537.36',
@@ -67,16 +75,16 @@ class InstagramProfileFinder:
     def _save_profiles(self):
         """Save discovered profiles to file."""
         try:
-            directory = os.path.dirname(self.output_file)
-            if directory and not os.path.exists(directory):
-                os.makedirs(directory)
-                
-            with open(self.output_file, 'w') as f:
-                json.dump({
-                    'profiles': list(self.profiles),
-                    'last_updated': time.strftime("%Y-%m-%d %H:%M:%S"),
-                    'count': len(self.profiles)
-                }, f, indent=2)
+            data = {
+                'profiles': list(self.profiles),
+                'last_updated': time.strftime("%Y-%m-%d %H:%M:%S"),
+                'count': len(self.profiles)
+            }
+            
+            if self.profile_writer is not None:
+                self.profile_writer.submit(self.output_file, data)
+            else:
+                save_json_atomic(data, self.output_file)
                 
             self.logger.info(f"Saved {len(self.profiles)} profiles to {self.output_file}")
         except Exception as e:
@@ -102,15 +110,19 @@ class InstagramProfileFinder:
         for attempt in range(max_retries):
             try:
                 headers = self._get_random_headers()
-                async with session.get(url, headers=headers, timeout=30) as response:
-                    if response.status == 200:
-                        return await response.text()
-                    elif response.status == 429:  # Too Many Requests
-                        self.logger.warning(f"Rate limited on {url}. Waiting before retry.")
-                        await asyncio.sleep(60 + random.randint(30, 120))  # Longer wait for rate limits
-                    else:
-                        self.logger.warning(f"Failed to fetch {url}: HTTP {response.status}")
-                        await asyncio.sleep(5 + attempt * 5)  # Increasing backoff
+                # Only hold a request slot for the request itself, not the backoff
+                async with request_slot(self.semaphore):
+                    async with session.get(url, headers=headers, timeout=30) as response:
+                        status = response.status
+                        if status == 200:
+                            return await response.text()
+                
+                if status == 429:  # Too Many Requests
+                    self.logger.warning(f"Rate limited on {url}. Waiting before retry.")
+                    await asyncio.sleep(60 + random.randint(30, 120))  # Longer wait for rate limits
+                else:
+                    self.logger.warning(f"Failed to fetch {url}: HTTP {status}")
+                    await asyncio.sleep(5 + attempt * 5)  # Increasing backoff
             except Exception as e:
                 self.logger.error(f"Error fetching {url}: {e}")
                 await asyncio.sleep(5 + attempt * 5)
@@ -183,7 +195,7 @@ class InstagramProfileFinder:
         """Find Instagram profiles from photography websites."""
         profiles = []
         
-        async with aiohttp.ClientSession() as session:
+        async with session_scope(self.session) as session:
             for site_url in self.photographer_sites:
                 try:
                     self.logger.info(f"Searching for profiles on {site_url}")
@@ -237,7 +249,7 @@ class InstagramProfileFinder:
         related_profiles = []
         checked_profiles = set()
         
-        async with aiohttp.ClientSession() as session:
+        async with session_scope(self.session) as session:
             for username in seed_profiles:
                 if len(related_profiles) >= max_profiles:
                     break
@@ -1,11 +1,13 @@
 import os
 import time
+import asyncio
 import json
 import logging
 from typing import List, Dict, Optional
 from utils.logger import get_logger
 from processing.face_encoder import FaceEncoder
 from utils.config import Config
+from scraper.utils import save_json_atomic
 
 class PlatformScrapeController:
     """
@@ -17,7 +19,9 @@ class PlatformScrapeController:
         self, 
         platform_name: str,
         profiles_file: Optional[str] = None,
-        output_dir: Optional[str] = None
+        output_dir: Optional[str] = None,
+        session=None,
+        profile_writer=None
     ):
         """
         Initialize the platform scrape controller.
@@ -26,6 +30,8 @@ class PlatformScrapeController:
             platform_name (str): Name of the social media platform
             profiles_file (str, optional): Path to store discovered profiles
             output_dir (str, optional): Directory to save downloaded images
+            session (aiohttp.ClientSession, optional): Shared HTTP session to reuse
+            profile_writer (ProfileWriter, optional): Shared writer for the profiles file
         """
         # Logger setup
         self.logger = get_logger(__name__)
@@ -50,6 +56,8 @@ class PlatformScrapeController:
         
         self.profiles_file = profiles_file
         self.output_dir = output_dir
+        self.session = session
+        self.profile_writer = profile_writer
         
         # Profiles storage
         self.profiles = []
@@ -88,8 +96,10 @@ class PlatformScrapeController:
                 'count': len(profiles)
             }
             
-            with open(self.profiles_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            if self.profile_writer is not None:
+                self.profile_writer.submit(self.profiles_file, data)
+            else:
+                save_json_atomic(data, self.profiles_file)
             
             self.logger.info(f"Saved {len(profiles)} {self.platform_name} profiles")
         except Exception as e:
@@ -183,6 +193,10 @@ class PlatformScrapeController:
         self.logger.info(f"Finding {self.platform_name} profiles (target: {profile_count})...")
         profiles = await self.find_profiles(target_count=profile_count)
         self._save_profiles(profiles)
+        if self.profile_writer is not None:
+            # The scraper reads the profiles file when it is created, so the
+            # coalesced write can't wait for the writer's next interval
+            await self.profile_writer.flush()
         
         # Step 2: Scrape images
         self.logger.info(f"Scraping images from {max_profiles_to_scrape} {self.platform_name} profiles...")
@@ -191,9 +205,10 @@ class PlatformScrapeController:
             max_images_per_profile=max_images_per_profile
         )
         
-        # Step 3: Process images for faces
+        # Step 3: Process images for faces in a worker thread to keep the event loop free
         self.logger.info("Processing scraped images for faces...")
-        faces_detected = self._process_images(self.output_dir)
+        loop = asyncio.get_event_loop()
+        faces_detected = await loop.run_in_executor(None, self._process_images, self.output_dir)
         
         # Calculate elapsed time
         elapsed = time.time() - start_time
@@ -0,0 +1,67 @@
+import asyncio
+from utils.logger import get_logger
+from scraper.utils import save_json_atomic
+
+class ProfileWriter:
+    """
+    Single writer for discovered-profile files, driven by an event loop.
+    
+    Scrapers submit the latest profile data instead of writing it themselves.
+    Submissions are coalesced per file and written atomically at most once
+    per interval, so readers never see a partially written file.
+    """
+    
+    def __init__(self, interval=5.0):
+        """
+        Initialize the profile writer.
+        
+        Args:
+            interval (float): Minimum seconds between writes of pending data.
+        """
+        self.logger = get_logger(__name__)
+        self.interval = interval
+        
+        # Latest unwritten data per file path
+        self._pending = {}
+        self._dirty = None
+    
+    def submit(self, file_path, data):
+        """
+        Queue data to be written to a file, replacing any unwritten data for it.
+        
+        Must be called on the writer's event loop.
+        
+        Args:
+            file_path (str): Path of the profiles file.
+            data (dict): JSON-serializable profiles data.
+        """
+        self._pending[file_path] = data
+        if self._dirty is not None:
+            self._dirty.set()
+    
+    async def run(self):
+        """Write pending data at most once per interval until cancelled."""
+        self._dirty = asyncio.Event()
+        if self._pending:
+            self._dirty.set()
+        
+        try:
+            while True:
+                await self._dirty.wait()
+                await asyncio.sleep(self.interval)
+                await self.flush()
+        finally:
+            self._dirty = None
+    
+    async def flush(self):
+        """Write all pending data now."""
+        if self._dirty is not None:
+            self._dirty.clear()
+        
+        pending, self._pending = self._pending, {}
+        loop = asyncio.get_running_loop()
+        for file_path, data in pending.items():
+            try:
+                await loop.run_in_executor(None, save_json_atomic, data, file_path)
+            except Exception as e:
+                self.logger.error(f"Error writing profiles to {file_path}: {e}")
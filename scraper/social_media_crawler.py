@@ -1,5 +1,4 @@
 import asyncio
-import aiohttp
 import time
 import random
 import os
@@ -8,16 +7,19 @@ from bs4 import BeautifulSoup
 import json
 from utils.logger import get_logger
 from utils.config import Config
-from scraper.utils import get_absolute_url
+from scraper.utils import get_absolute_url, session_scope
 from scraper.person_detector import RealPersonDetector
 
 class SocialMediaCrawler:
     """Web crawler specialized for public social media and community sites."""
     
-    def __init__(self):
+    def __init__(self, session=None):
         self.logger = get_logger(__name__)
         self.config = Config()
         
+        # Shared HTTP session, if provided by the caller
+        self.session = session
+        
         # Load crawler settings from config
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/96.0.4664.110 Safari/537.36',
@@ -208,7 +210,7 @@ class SocialMediaCrawler:
                     score += 1
             return score
         
-        async with aiohttp.ClientSession() as session:
+        async with session_scope(self.session) as session:
             while to_visit_urls and len(visited_urls) < max_pages and len(all_images) < max_images:
                 # Instead of just popping, prioritize URLs
                 if to_visit_urls:
@@ -16,7 +16,9 @@ class TwitterScrapeController(PlatformScrapeController):
     def __init__(
         self, 
         profiles_file: str = "data/twitter_profiles.json", 
-        output_dir: str = "data/downloaded_images/twitter"
+        output_dir: str = "data/downloaded_images/twitter",
+        session=None,
+        profile_writer=None
     ):
         """
         Initialize the Twitter scrape controller.
@@ -24,11 +26,15 @@ class TwitterScrapeController(PlatformScrapeController):
         Args:
             profiles_file (str): Path to store discovered profiles
             output_dir (str): Directory to save downloaded images
+            session (aiohttp.ClientSession, optional): Shared HTTP session to reuse
+            profile_writer (ProfileWriter, optional): Shared writer for the profiles file
         """
         super().__init__(
             platform_name="Twitter", 
             profiles_file=profiles_file, 
-            output_dir=output_dir
+            output_dir=output_dir,
+            session=session,
+            profile_writer=profile_writer
         )
         
         # Predefined search terms to find profiles
@@ -115,10 +121,14 @@ class TwitterScrapeController(PlatformScrapeController):
             profiles_file=self.profiles_file
         )
         
-        # Scrape images
-        images = scraper.run(
-            max_profiles=max_profiles, 
-            max_images_per_profile=max_images_per_profile
+        # Scrape images in a worker thread since Selenium blocks
+        loop = asyncio.get_event_loop()
+        images = await loop.run_in_executor(
+            None,
+            lambda: scraper.run(
+                max_profiles=max_profiles, 
+                max_images_per_profile=max_images_per_profile
+            )
         )
         
         self.logger.info(f"Downloaded {len(images)} images from Twitter")
@@ -128,7 +138,9 @@ class TwitterScrapeController(PlatformScrapeController):
 async def scrape_twitter_profiles(
     profile_count: int = 200, 
     max_profiles_to_scrape: int = 5, 
-    max_images_per_profile: int = 10
+    max_images_per_profile: int = 10,
+    session=None,
+    profile_writer=None
 ) -> dict:
     """
     Convenience function to run the full Twitter scraping pipeline.
@@ -137,11 +149,16 @@ async def scrape_twitter_profiles(
         profile_count (int): Number of profiles to discover
         max_profiles_to_scrape (int): Maximum profiles to scrape
         max_images_per_profile (int): Maximum images to download per profile
+        session (aiohttp.ClientSession, optional): Shared HTTP session to reuse
+        profile_writer (ProfileWriter, optional): Shared writer for the profiles file
     
     Returns:
         dict: Scraping process statistics
     """
-    controller = TwitterScrapeController()
+    controller = TwitterScrapeController(
+        session=session,
+        profile_writer=profile_writer
+    )
     return await controller.run_full_pipeline(
         profile_count=profile_count,
         max_profiles_to_scrape=max_profiles_to_scrape,
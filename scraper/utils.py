@@ -1,9 +1,18 @@
 import json
 import os
+from contextlib import asynccontextmanager
 from urllib.parse import urljoin, urlparse
 import hashlib
+import tempfile
+import aiohttp
 from utils.logger import get_logger
 
+try:
+    import orjson
+except ImportError:
+    # orjson is optional; fall back to the standard library serializer
+    orjson = None
+
 logger = get_logger(__name__)
 
 def get_absolute_url(base_url, link):
@@ -88,6 +97,70 @@ def ensure_directory(directory):
         logger.error(f"Error ensuring directory exists: {e}")
         raise
 
+def save_json_atomic(data, file_path):
+    """
+    Write data to a JSON file atomically.
+    
+    The data is written to a temporary file in the same directory, which then
+    replaces the target, so readers never see a partially written file.
+    
+    Args:
+        data: JSON-serializable data.
+        file_path (str): Path of the file to write.
+    """
+    directory = os.path.dirname(file_path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(data, indent=2).encode('utf-8')
+    
+    fd, temp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
+        os.replace(temp_path, file_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+@asynccontextmanager
+async def session_scope(session=None):
+    """
+    Yield an HTTP session, creating a temporary one if none is shared.
+    
+    A shared session is left open for its owner to close; a temporary session
+    is closed on exit.
+    
+    Args:
+        session (aiohttp.ClientSession, optional): Shared session to reuse.
+        
+    Yields:
+        aiohttp.ClientSession: Session to issue requests with.
+    """
+    if session is not None:
+        yield session
+    else:
+        async with aiohttp.ClientSession() as new_session:
+            yield new_session
+
+@asynccontextmanager
+async def request_slot(semaphore=None):
+    """
+    Hold a slot of a shared request limit for the duration of an HTTP call.
+    
+    Args:
+        semaphore (asyncio.Semaphore, optional): Limit on in-flight requests.
+            No limit is applied if omitted.
+    """
+    if semaphore is None:
+        yield
+    else:
+        async with semaphore:
+            yield
+
 def get_image_urls_from_json(json_path='crawler_state.json'):
     """
     Get image URLs from a JSON file.
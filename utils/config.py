@@ -53,6 +53,7 @@ class Config:
         """Set default configuration values if no config file is found."""
         self.config['Paths'] = {
             'DatabaseFolder': 'data/database',
+            'DatabaseFormat': 'sqlite',
             'ImageFolder': 'data/images',
             'CroppedFaceFolder': 'data/cropped_faces'
         }
@@ -61,18 +62,22 @@ class Config:
             'DetectionThreshold': '0.8',
             'DetectionSize': '640',
             'UseGPU': 'True',
-            'GPUId': '0'
+            'GPUId': '0',
+            'DetectionProcesses': 'auto',
+            'CropWriterThreads': '0'
         }
         
         self.config['FaceMatching'] = {
             'SimilarityThreshold': '0.6',
             'TopMatches': '10',
-            'ForwardFacingThreshold': '20'
+            'ForwardFacingThreshold': '20',
+            'EmbeddingFormat': 'int8'
         }
         
         self.config['GUI'] = {
             'CanvasWidth': '500',
-            'CanvasHeight': '500'
+            'CanvasHeight': '500',
+            'ResampleFilter': 'LANCZOS'
         }
     
     def _ensure_directories(self):
@@ -104,6 +109,18 @@ class Config:
         size = self.getint('FaceDetection', 'DetectionSize', fallback=640)
         return (size, size)
     
+    def get_detection_processes(self):
+        """
+        Get the number of detection worker processes for CPU-only encoding.
+        
+        'auto' uses half the CPU cores, at most 4, since every process loads
+        its own copy of the models.
+        """
+        value = self.get('FaceDetection', 'DetectionProcesses', fallback='auto').strip().lower()
+        if value == 'auto':
+            return max(1, min(4, (os.cpu_count() or 1) // 2))
+        return int(value)
+    
     def get_gpu_id(self):
         """Get the GPU ID, or -1 if GPU is disabled."""
         if self.getboolean('FaceDetection', 'UseGPU', fallback=True):